@@ -6,7 +6,7 @@ initial backfill cap, rich sentiment, and clean one-newline formatting.
 
 Setup:
   pip install -U pip
-  pip install feedparser httpx trafilatura readability-lxml beautifulsoup4 nltk transformers torch tenacity python-dateutil python-dotenv
+  pip install feedparser "httpx[http2,brotli,zstd]" aiolimiter xxhash orjson trafilatura readability-lxml selectolax nltk transformers torch tenacity python-dateutil python-dotenv
   python -c "import nltk; nltk.download('vader_lexicon')"
 
 .env (example):
@@ -18,23 +18,33 @@ Setup:
   REGION_TZ=Asia/Singapore
   POST_ONLY_ON_STRONG_MATCH=false
   MAX_AGE_DAYS=2
+  FEED_CONCURRENCY=10
+  HOST_CONCURRENCY=4
+  SEEN_RETENTION_DAYS=30
+  HF_ONNX_INT8=true
+  HF_ONNX_DIR=./onnx-int8
 """
 
 from __future__ import annotations
-import os, time, json, re, sqlite3, asyncio, hashlib, logging, html, math
+import os, time, re, sqlite3, asyncio, logging, html, math, threading
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, List, Tuple
 from urllib.parse import urlparse
 
 import feedparser
 import httpx
+import orjson
 import trafilatura
-from bs4 import BeautifulSoup
+import xxhash
 from readability import Document
+from selectolax.lexbor import LexborHTMLParser
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from dateutil import parser as dtparse
 from dotenv import load_dotenv
 
+from telegram_limits import TG_LIMITER, chat_limiters
+
 # Sentiment libs (HF + VADER fallback)
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
@@ -49,6 +59,12 @@ DB_PATH = os.getenv("DB_PATH", "./bot.db")
 REGION_TZ = os.getenv("REGION_TZ", "Asia/Singapore")
 POST_ONLY_ON_STRONG_MATCH = os.getenv("POST_ONLY_ON_STRONG_MATCH", "false").lower() == "true"
 MAX_AGE_DAYS = int(os.getenv("MAX_AGE_DAYS", "2"))   # cap backfill
+FEED_CONCURRENCY = int(os.getenv("FEED_CONCURRENCY", "10"))  # feeds processed at once
+HOST_CONCURRENCY = int(os.getenv("HOST_CONCURRENCY", "4"))   # article GETs per origin at once
+SEEN_RETENTION_DAYS = max(int(os.getenv("SEEN_RETENTION_DAYS", "30")), MAX_AGE_DAYS + 1)
+SEEN_PRUNE_EVERY = 24 * 3600
+HF_ONNX_INT8 = os.getenv("HF_ONNX_INT8", "true").lower() == "true"  # CPU only; needs optimum[onnxruntime]
+HF_ONNX_DIR = os.getenv("HF_ONNX_DIR", "./onnx-int8")
 TIMEOUT = 20.0
 
 if not BOT_TOKEN or not CHAT_ID:
@@ -132,10 +148,15 @@ CRYPTO_TERMS = [
 ]
 HYPERLIQUID_TERMS = [r"\bhyper ?liquid\b", r"\bhyperliquid\b", r"\bhl perps?\b", r"hyperliquid exchange"]
 
-MACRO_REGEX = re.compile("|".join(MACRO_TERMS), re.IGNORECASE)
-CRYPTO_REGEX = re.compile("|".join(CRYPTO_TERMS), re.IGNORECASE)
 HYPER_REGEX = re.compile("|".join(HYPERLIQUID_TERMS), re.IGNORECASE)
 
+# All three families in one alternation; the group name's first letter (m/c/h) tags the family,
+# so a single finditer pass counts macro, crypto and Hyperliquid hits together.
+FILTER_TERMS = ([("m", p) for p in MACRO_TERMS] + [("c", p) for p in CRYPTO_TERMS]
+                + [("h", p) for p in HYPERLIQUID_TERMS])
+FILTER_REGEX = re.compile("|".join(f"(?P<{tag}{i}>{p})" for i, (tag, p) in enumerate(FILTER_TERMS)),
+                          re.IGNORECASE)
+
 DISPLAY_KEYWORDS = [
     ("cpi", r"\bcpi\b"), ("pce", r"\bpce\b"), ("inflation", r"\binflation\b"), ("deflation", r"\bdeflation\b"),
     ("FOMC", r"\bfomc\b"), ("rate hike", r"rate hike"), ("rate cut", r"rate cut"), ("Fed", r"\bfed\b"),
@@ -151,15 +172,70 @@ DISPLAY_KEYWORDS = [
     ("token", r"\btoken(s)?\b"), ("NFT", r"\bnft(s)?\b"),
     ("Hyperliquid", r"\bhyper ?liquid\b|\bhyperliquid\b|\bhl perps?\b"),
 ]
-DISPLAY_KEYWORDS_COMPILED = [(name, re.compile(pat, re.IGNORECASE)) for name, pat in DISPLAY_KEYWORDS]
+
+def _kw_group(name: str) -> str:
+    return "k_" + re.sub(r"\W", "_", name)  # "rate hike" -> "k_rate_hike"
+
+# One alternation for all display keywords; group name -> (priority, display name).
+DISPLAY_REGEX = re.compile("|".join(f"(?P<{_kw_group(name)}>{pat})" for name, pat in DISPLAY_KEYWORDS),
+                           re.IGNORECASE)
+DISPLAY_GROUPS = {_kw_group(name): (i, name) for i, (name, _) in enumerate(DISPLAY_KEYWORDS)}
 
 # ---------- Storage ----------
+# One long-lived connection (opened by init_db) instead of connect/close per lookup.
+_DB: Optional[sqlite3.Connection] = None
+_DB_PATH: Optional[str] = None
+_DB_LOCK = threading.Lock()
+
+class BloomFilter:
+    """Fixed-size Bloom filter over str keys (double hashing on one 128-bit XXH3 digest)."""
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        d = xxhash.xxh3_128_intdigest(item.encode("utf-8", errors="ignore"))
+        h1, h2 = d >> 64, (d & 0xFFFFFFFFFFFFFFFF) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for p in self._positions(item):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+# Every (feed, key) in `seen`; a miss means "definitely new" and skips SQLite entirely.
+_BLOOM = BloomFilter(capacity=200_000, error_rate=0.001)
+
+# prune_seen deletes in batches this size, releasing _DB_LOCK in between
+PRUNE_BATCH = 5000
+
+# Bloom keys flushed while prune_seen rebuilds the filter (None when no rebuild is running)
+_bloom_added: Optional[list] = None
+
+def _bloom_key(feed: str, key: str) -> str:
+    return f"{feed}\0{key}"
+
+def _load_bloom(conn: sqlite3.Connection) -> BloomFilter:
+    bloom = BloomFilter(capacity=200_000, error_rate=0.001)
+    for feed, key in conn.execute("SELECT feed, entry_key FROM seen"):
+        bloom.add(_bloom_key(feed, key))
+    return bloom
+
 def init_db(path: str) -> None:
+    global _DB, _DB_PATH, _BLOOM
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    conn = sqlite3.connect(path)
-    cur = conn.cursor()
-    cur.executescript("""
+    if _DB is not None:
+        _DB.close()
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.executescript("""
     PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-20000;
     CREATE TABLE IF NOT EXISTS seen (
       feed TEXT NOT NULL,
       entry_key TEXT NOT NULL,
@@ -167,30 +243,104 @@ def init_db(path: str) -> None:
       first_seen_ts INTEGER NOT NULL,
       PRIMARY KEY(feed, entry_key)
     );
+    CREATE INDEX IF NOT EXISTS ix_seen_first ON seen(first_seen_ts);
+    CREATE TABLE IF NOT EXISTS feed_meta (
+      feed TEXT PRIMARY KEY,
+      etag TEXT,
+      last_modified TEXT
+    );
     """)
     conn.commit()
-    conn.close()
-
-def seen_before(path: str, feed: str, key: str) -> bool:
-    conn = sqlite3.connect(path)
-    cur = conn.cursor()
-    cur.execute("SELECT 1 FROM seen WHERE feed=? AND entry_key=? LIMIT 1", (feed, key))
-    row = cur.fetchone()
-    conn.close()
-    return row is not None
-
-def mark_seen(path: str, feed: str, key: str, published_ts: Optional[int]) -> None:
-    conn = sqlite3.connect(path)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR IGNORE INTO seen(feed, entry_key, published_ts, first_seen_ts) VALUES (?,?,?,?)",
-        (feed, key, published_ts, int(time.time()))
-    )
-    conn.commit()
-    conn.close()
+    _BLOOM = _load_bloom(conn)
+    _DB, _DB_PATH = conn, path
+
+def seen_keys(feed: str, keys: List[str]) -> set:
+    """Subset of `keys` already recorded for `feed`; only Bloom "maybe" hits reach SQLite."""
+    maybe = [k for k in keys if _bloom_key(feed, k) in _BLOOM]
+    found = set()
+    with _DB_LOCK:
+        for i in range(0, len(maybe), 500):  # stay under SQLite's bound-variable limit
+            chunk = maybe[i:i + 500]
+            q = f"SELECT entry_key FROM seen WHERE feed=? AND entry_key IN ({','.join('?' * len(chunk))})"
+            found.update(row[0] for row in _DB.execute(q, (feed, *chunk)))
+    return found
+
+def mark_seen(pending: list, feed: str, key: str, published_ts: Optional[int]) -> None:
+    """Queue a row for flush_seen; writes are batched per feed pass."""
+    pending.append((feed, key, published_ts, int(time.time())))
+
+def flush_seen(rows: list) -> None:
+    if not rows:
+        return
+    with _DB_LOCK:
+        with _DB:
+            _DB.executemany(
+                "INSERT OR IGNORE INTO seen(feed, entry_key, published_ts, first_seen_ts) VALUES (?,?,?,?)",
+                rows
+            )
+        for feed, key, _, _ in rows:
+            bkey = _bloom_key(feed, key)
+            _BLOOM.add(bkey)
+            if _bloom_added is not None:
+                _bloom_added.append(bkey)
+    rows.clear()
+
+def prune_seen(retention_days: int) -> int:
+    """
+    Delete rows first seen more than `retention_days` ago, then rebuild the Bloom filter and
+    truncate the WAL. Undated rows are kept: too_old() can't catch them, so they'd be re-posted.
+    _DB_LOCK is also taken on the event loop, so it is only held per PRUNE_BATCH-row DELETE
+    and for the final swap; the rebuild reads through its own connection, and keys flushed
+    meanwhile are replayed into it.
+    """
+    global _BLOOM, _bloom_added
+    cutoff = int(time.time()) - retention_days * 86400
+    deleted = 0
+    while True:
+        with _DB_LOCK, _DB:
+            n = _DB.execute(
+                """DELETE FROM seen WHERE rowid IN (
+                     SELECT rowid FROM seen WHERE first_seen_ts < ? AND published_ts IS NOT NULL LIMIT ?)""",
+                (cutoff, PRUNE_BATCH)
+            ).rowcount
+        deleted += n
+        if n < PRUNE_BATCH:
+            break
+    with _DB_LOCK:
+        _bloom_added = []
+    try:
+        conn = sqlite3.connect(_DB_PATH)
+        try:
+            bloom = _load_bloom(conn)
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+        with _DB_LOCK:
+            for bkey in _bloom_added:
+                bloom.add(bkey)
+            _BLOOM = bloom
+    finally:
+        with _DB_LOCK:
+            _bloom_added = None
+    return deleted
+
+def get_feed_meta(feed: str) -> Tuple[Optional[str], Optional[str]]:
+    """(ETag, Last-Modified) from the feed's last full fetch, for conditional GETs."""
+    with _DB_LOCK:
+        row = _DB.execute("SELECT etag, last_modified FROM feed_meta WHERE feed=?", (feed,)).fetchone()
+    return row or (None, None)
+
+def save_feed_meta(feed: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+    with _DB_LOCK, _DB:
+        _DB.execute(
+            "INSERT OR REPLACE INTO feed_meta(feed, etag, last_modified) VALUES (?,?,?)",
+            (feed, etag, last_modified)
+        )
 
 # ---------- Utilities ----------
+@lru_cache(maxsize=4096)
 def to_unix_ts(dt_str: Optional[str]) -> Optional[int]:
+    """Memoized: feeds repeat the same dates every poll and dateutil parsing is slow."""
     if not dt_str:
         return None
     try:
@@ -201,8 +351,9 @@ def to_unix_ts(dt_str: Optional[str]) -> Optional[int]:
     except Exception:
         return None
 
-def sha256(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8", errors="ignore")).hexdigest()
+def fast_hash(s: str) -> str:
+    """Non-cryptographic 64-bit XXH3 hex digest; only used as a stable dedup key."""
+    return xxhash.xxh3_64_hexdigest(s.encode("utf-8", errors="ignore"))
 
 def entry_key(entry) -> str:
     for k in ("id", "guid"):
@@ -213,7 +364,7 @@ def entry_key(entry) -> str:
         return entry.link
     title = getattr(entry, "title", "") or ""
     pub = getattr(entry, "published", "") or ""
-    return sha256(f"{title}|{pub}")
+    return fast_hash(f"{title}|{pub}")
 
 def first_nonempty(*vals) -> str:
     for v in vals:
@@ -235,20 +386,19 @@ def host_of(url: str) -> str:
     except Exception:
         return ""
 
-def read_time_minutes(text: str, wpm: int = 220) -> int:
-    words = max(1, len(text.split()))
-    return max(1, int(math.ceil(words / wpm)))
+def read_time_minutes(words: int, wpm: int = 220) -> int:
+    words = max(1, words)
+    return max(1, (words + wpm - 1) // wpm)
 
 def pick_keywords(text: str, limit: int = 6) -> List[str]:
-    text = text or ""
-    seen = []
-    for name, pat in DISPLAY_KEYWORDS_COMPILED:
-        if pat.search(text):
-            if name not in seen:
-                seen.append(name)
-        if len(seen) >= limit:
-            break
-    return seen
+    """Up to `limit` matched display keywords, in DISPLAY_KEYWORDS order, from one regex pass."""
+    found = {}
+    for m in DISPLAY_REGEX.finditer(text or ""):
+        if m.lastgroup not in found:
+            found[m.lastgroup] = DISPLAY_GROUPS[m.lastgroup]
+            if len(found) == len(DISPLAY_GROUPS):
+                break
+    return [name for _, name in sorted(found.values())[:limit]]
 
 def why_it_matters(text: str) -> Optional[str]:
     t = (text or "").lower()
@@ -272,16 +422,36 @@ def too_old(pub_ts: Optional[int]) -> bool:
     return (time.time() - pub_ts) > MAX_AGE_DAYS * 86400
 
 # ---------- Extraction ----------
+# Created per run_loop so they bind to the running event loop.
+_feed_sem: Optional[asyncio.Semaphore] = None
+_host_sems: dict = {}
+
+def host_sem(url: str) -> asyncio.Semaphore:
+    host = host_of(url)
+    sem = _host_sems.get(host)
+    if sem is None:
+        sem = _host_sems[host] = asyncio.Semaphore(HOST_CONCURRENCY)
+    return sem
+
 async def fetch_text(client: httpx.AsyncClient, url: str) -> Optional[str]:
     if not url:
         return None
     try:
-        r = await client.get(url, timeout=TIMEOUT)
+        async with host_sem(url):
+            r = await client.get(url)
         r.raise_for_status()
         return r.text
     except Exception:
         return None
 
+def html_to_text(markup: str) -> str:
+    # selectolax (C lexbor parser) is far cheaper than building a BeautifulSoup tree for get_text.
+    tree = LexborHTMLParser(markup)
+    # get_text skips script/style contents; selectolax's .text() does not
+    tree.strip_tags(["script", "style", "noscript", "template"])
+    node = tree.body or tree.root
+    return node.text(separator=" ", strip=True) if node is not None else ""
+
 def extract_fulltext(html_text: Optional[str], url: str) -> Optional[str]:
     if not html_text:
         return None
@@ -296,16 +466,14 @@ def extract_fulltext(html_text: Optional[str], url: str) -> Optional[str]:
     try:
         doc = Document(html_text)
         content_html = doc.summary(html_partial=True)
-        soup = BeautifulSoup(content_html, "lxml")
-        text = soup.get_text(separator=" ", strip=True)
+        text = html_to_text(content_html)
         if text and len(text) > 200:
             return text
     except Exception:
         pass
-    # Fallback plain soup
+    # Fallback plain page text
     try:
-        soup = BeautifulSoup(html_text, "lxml")
-        text = soup.get_text(separator=" ", strip=True)
+        text = html_to_text(html_text)
         if text and len(text) > 200:
             return text
     except Exception:
@@ -313,22 +481,21 @@ def extract_fulltext(html_text: Optional[str], url: str) -> Optional[str]:
     return None
 
 # ---------- Filtering ----------
-def matches_filters(title: str, summary: str, body: str) -> Tuple[bool, bool, bool]:
-    text = " ".join([title or "", summary or "", body or ""])
-
-    hyper = bool(HYPER_REGEX.search(text))
-    macro_hits = MACRO_REGEX.findall(text)
-    crypto_hits = CRYPTO_REGEX.findall(text)
+def matches_filters(text: str) -> Tuple[bool, bool, bool]:
+    """(include, macro, crypto) for an entry's combined title/summary/body text."""
+    hits = {"m": 0, "c": 0, "h": 0}
+    for m in FILTER_REGEX.finditer(text):
+        hits[m.lastgroup[0]] += 1
 
-    macro = bool(macro_hits)
-    crypto = bool(crypto_hits)
+    macro = hits["m"] > 0
+    crypto = hits["c"] > 0
 
-    if hyper:
+    if hits["h"]:
         return True, True, True
 
     if POST_ONLY_ON_STRONG_MATCH:
         # strong if both families present OR any one family has 2+ keyword hits
-        strong = (macro and crypto) or (len(macro_hits) >= 2) or (len(crypto_hits) >= 2)
+        strong = (macro and crypto) or (hits["m"] >= 2) or (hits["c"] >= 2)
         return strong, macro, crypto
 
     return (macro or crypto), macro, crypto
@@ -340,24 +507,73 @@ except LookupError:
     nltk.download("vader_lexicon")
 VADER = SentimentIntensityAnalyzer()
 
-_finbert = None
+# Primary: distilled financial-news model (~82M params). The Twitter RoBERTa is only
+# consulted for texts where the primary is unsure, so most articles cost one forward pass.
+FIN_MODEL = "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
+ROB_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+FIN_MIN_CONFIDENCE = 0.7
+
+_fin = None
 _rob = None
+_rob_unavailable = False  # set once the tie-breaker failed to load, so it isn't retried every batch
+_HF_LOCK = threading.Lock()  # batches arrive from worker threads; run one inference at a time
+
+def _load_onnx_int8(name: str):
+    """
+    Dynamically INT8-quantized ONNX Runtime model for CPU, exported once into HF_ONNX_DIR.
+    Returns None if optimum/onnxruntime isn't installed or the export fails.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    except ImportError:
+        return None
+    out_dir = os.path.join(HF_ONNX_DIR, name.replace("/", "--"))
+    try:
+        if not os.path.exists(os.path.join(out_dir, "model_quantized.onnx")):
+            log.info(f"Exporting {name} to INT8 ONNX in {out_dir} (one-off)...")
+            fp32 = ORTModelForSequenceClassification.from_pretrained(name, export=True)
+            qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+            ORTQuantizer.from_pretrained(fp32).quantize(save_dir=out_dir, quantization_config=qconfig)
+        return ORTModelForSequenceClassification.from_pretrained(out_dir, file_name="model_quantized.onnx")
+    except Exception as e:
+        log.warning(f"INT8 ONNX unavailable for {name}, using PyTorch: {e}")
+        return None
+
+def _build_pipeline(name: str):
+    """FP16 on CUDA, INT8 ONNX Runtime on CPU when available, FP32 PyTorch otherwise."""
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
+    device = 0 if torch.cuda.is_available() else -1
+    # CPU stays FP32: BF16 is only a win on CPUs with AMX/AVX512-BF16 and is slower elsewhere.
+    dtype = torch.float16 if device == 0 else torch.float32
+    tok = AutoTokenizer.from_pretrained(name)
+    if device == -1 and HF_ONNX_INT8:
+        ort = _load_onnx_int8(name)
+        if ort is not None:
+            return pipeline("sentiment-analysis", model=ort, tokenizer=tok, truncation=True, batch_size=16)
+    mod = AutoModelForSequenceClassification.from_pretrained(name, torch_dtype=dtype)
+    return pipeline("sentiment-analysis", model=mod, tokenizer=tok, device=device,
+                    truncation=True, batch_size=16)
 
 def load_hf_models():
-    """Lazy load HF models once."""
-    global _finbert, _rob
-    if _finbert is None or _rob is None:
-        from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
-        finbert_name = "ProsusAI/finbert"
-        tok_f = AutoTokenizer.from_pretrained(finbert_name)
-        mod_f = AutoModelForSequenceClassification.from_pretrained(finbert_name)
-        _finbert = pipeline("sentiment-analysis", model=mod_f, tokenizer=tok_f, truncation=True)
-        rob_name = "cardiffnlp/twitter-roberta-base-sentiment-latest"
-        tok_r = AutoTokenizer.from_pretrained(rob_name)
-        mod_r = AutoModelForSequenceClassification.from_pretrained(rob_name)
-        _rob = pipeline("sentiment-analysis", model=mod_r, tokenizer=tok_r, truncation=True)
-
-def map_finbert(label: str) -> str:
+    """Lazy load the primary HF model once."""
+    global _fin
+    if _fin is None:
+        _fin = _build_pipeline(FIN_MODEL)
+
+def load_fallback_model():
+    """Load the RoBERTa tie-breaker once; if it can't be loaded, the primary model scores alone."""
+    global _rob, _rob_unavailable
+    if _rob is not None or _rob_unavailable:
+        return
+    try:
+        _rob = _build_pipeline(ROB_MODEL)
+    except Exception as e:
+        _rob_unavailable = True
+        log.warning(f"Could not load {ROB_MODEL}, scoring with {FIN_MODEL} alone: {e}")
+
+def map_fin(label: str) -> str:
     l = label.lower()
     if "pos" in l: return "pos"
     if "neg" in l: return "neg"
@@ -372,6 +588,79 @@ def map_roberta(label: str) -> str:
 def human_label(l: str) -> str:
     return {"pos":"🟢 Positive","neu":"⚪ Neutral","neg":"🔴 Negative"}.get(l, "⚪ Neutral")
 
+def _vader_sentiment(text: str) -> dict:
+    comp = VADER.polarity_scores(text)["compound"]
+    label = "pos" if comp >= 0.3 else "neg" if comp <= -0.3 else "neu"
+    return {"label": label, "score": (comp + 1) / 2.0, "compound": comp,
+            "fin": None, "roberta": None, "vader": {"compound": comp}}
+
+def _ensemble(t: str, f: dict, r: Optional[dict] = None) -> dict:
+    def as_num(m: str) -> int:
+        return 1 if m == "pos" else -1 if m == "neg" else 0
+
+    lf, sf = map_fin(f["label"]), float(f.get("score", 0.5))
+    nf = as_num(lf)
+
+    # Both paths scale with confidence: 0.6/0.4 of each model's signed score, not
+    # renormalized by the scores (which would saturate to ±1 whenever the models agree).
+    if r is None:
+        comp = nf * sf
+    else:
+        lr, sr = map_roberta(r["label"]), float(r.get("score", 0.5))
+        nr = as_num(lr)
+        comp = (nf * 0.6 * sf + nr * 0.4 * sr) / (0.6 + 0.4)
+
+    lower = t.lower()
+    if "rate hike" in lower or "hawkish" in lower or "liquidity crunch" in lower:
+        comp -= 0.05
+    if "etf approval" in lower or "rate cut" in lower or "dovish" in lower:
+        comp += 0.05
+    comp = max(-1.0, min(1.0, comp))
+
+    label = "pos" if comp >= 0.25 else "neg" if comp <= -0.25 else "neu"
+    return {"label": label, "score": (comp + 1) / 2.0, "compound": comp,
+            "fin": {"label": lf, "score": sf},
+            "roberta": {"label": lr, "score": sr} if r is not None else None,
+            "vader": None}
+
+def sentiment_ensemble_batch(texts: List[str]) -> List[dict]:
+    """
+    sentiment_ensemble over many texts with one batched pass of the financial model; RoBERTa
+    (when loaded) is batched over just the texts it scored below FIN_MIN_CONFIDENCE.
+    Texts shorter than 16 chars (and everything, if HF inference fails) are scored by VADER.
+    """
+    texts = [(t or "").strip() for t in texts]
+    results: List[Optional[dict]] = [None] * len(texts)
+    hf_idx = []
+    for i, t in enumerate(texts):
+        if len(t) < 16:
+            results[i] = _vader_sentiment(t)
+        else:
+            hf_idx.append(i)
+    if not hf_idx:
+        return results
+
+    try:
+        load_hf_models()
+        batch = [texts[i][:1200] for i in hf_idx]
+        with _HF_LOCK:
+            fs = _fin(batch, batch_size=16)
+            unsure = [j for j, f in enumerate(fs) if float(f.get("score", 0.0)) < FIN_MIN_CONFIDENCE]
+            rs: dict = {}
+            if unsure and _rob is not None:
+                # The tie-breaker is optional: if it fails, keep the primary's scores
+                try:
+                    rs = dict(zip(unsure, _rob([batch[j] for j in unsure], batch_size=16)))
+                except Exception as e:
+                    log.warning(f"{ROB_MODEL} failed, scoring with {FIN_MODEL} alone: {e}")
+        for j, (i, t, f) in enumerate(zip(hf_idx, batch, fs)):
+            results[i] = _ensemble(t, f, rs.get(j))
+    except Exception as e:
+        log.warning(f"HF sentiment failed, falling back to VADER: {e}")
+        for i in hf_idx:
+            results[i] = _vader_sentiment(texts[i])
+    return results
+
 def sentiment_ensemble(text: str) -> dict:
     """
     Returns:
@@ -379,59 +668,17 @@ def sentiment_ensemble(text: str) -> dict:
       "label": "pos|neu|neg",
       "score": float 0..1,          # ensemble confidence (mapped from compound)
       "compound": float -1..1,      # ensemble signed score
-      "finbert": {"label": "...", "score": 0..1} | None,
-      "roberta": {"label": "...", "score": 0..1} | None,
+      "fin": {"label": "...", "score": 0..1} | None,
+      "roberta": {"label": "...", "score": 0..1} | None,   # only when "fin" was low-confidence
       "vader": {"compound": -1..1} | None
     }
     """
-    text = (text or "").strip()
-    if len(text) < 16:
-        v = VADER.polarity_scores(text)
-        comp = v["compound"]
-        label = "pos" if comp >= 0.3 else "neg" if comp <= -0.3 else "neu"
-        return {"label": label, "score": (comp + 1) / 2, "compound": comp,
-                "finbert": None, "roberta": None, "vader": {"compound": comp}}
-
-    try:
-        load_hf_models()
-        t = text[:1200]
-        f = _finbert(t)[0]
-        r = _rob(t)[0]
-
-        def as_num_fin(lab: str) -> int:
-            m = map_finbert(lab); return 1 if m=="pos" else -1 if m=="neg" else 0
-        def as_num_rob(lab: str) -> int:
-            m = map_roberta(lab); return 1 if m=="pos" else -1 if m=="neg" else 0
-
-        lf, sf = map_finbert(f["label"]), float(f.get("score", 0.5))
-        lr, sr = map_roberta(r["label"]), float(r.get("score", 0.5))
-        nf, nr = as_num_fin(lf), as_num_rob(lr)
-
-        wf, wr = 0.6 * sf, 0.4 * sr
-        denom = max(1e-6, wf + wr)
-        comp = (nf * wf + nr * wr) / denom
-
-        lower = t.lower()
-        if "rate hike" in lower or "hawkish" in lower or "liquidity crunch" in lower:
-            comp -= 0.05
-        if "etf approval" in lower or "rate cut" in lower or "dovish" in lower:
-            comp += 0.05
-        comp = max(-1.0, min(1.0, comp))
-
-        label = "pos" if comp >= 0.25 else "neg" if comp <= -0.25 else "neu"
-        return {"label": label, "score": (comp + 1) / 2.0, "compound": comp,
-                "finbert": {"label": lf, "score": sf},
-                "roberta": {"label": lr, "score": sr},
-                "vader": None}
-    except Exception as e:
-        log.warning(f"HF sentiment failed, falling back to VADER: {e}")
-        v = VADER.polarity_scores(text)
-        comp = v["compound"]
-        label = "pos" if comp >= 0.3 else "neg" if comp <= -0.3 else "neu"
-        return {"label": label, "score": (comp + 1) / 2.0, "compound": comp,
-                "finbert": None, "roberta": None, "vader": {"compound": comp}}
+    return sentiment_ensemble_batch([text])[0]
 
 # ---------- Telegram ----------
+# Telegram flood limits (shared with the X bot): ~30 msg/s per bot, 1 msg/s and 20 msg/min per group.
+TG_CHAT_SECOND, TG_CHAT_MINUTE = chat_limiters(CHAT_ID)
+
 async def tg_send(client: httpx.AsyncClient, text: str) -> None:
     payload = {
         "chat_id": CHAT_ID,
@@ -441,19 +688,22 @@ async def tg_send(client: httpx.AsyncClient, text: str) -> None:
     }
     if THREAD_ID:
         payload["message_thread_id"] = int(THREAD_ID)
+    body = orjson.dumps(payload)
 
     while True:
-        r = await client.post(f"{TELEGRAM_API}/sendMessage", json=payload, timeout=TIMEOUT)
+        async with TG_LIMITER, TG_CHAT_SECOND, TG_CHAT_MINUTE:
+            r = await client.post(f"{TELEGRAM_API}/sendMessage", content=body,
+                                  headers={"content-type": "application/json"})
         if r.status_code != 429:
             r.raise_for_status()
-            data = r.json()
+            data = orjson.loads(r.content)
             if not data.get("ok"):
                 log.warning(f"Telegram API error: {data}")
             return
         # Respect Telegram flood control
         retry_after = 3
         try:
-            retry_after = int(r.headers.get("Retry-After") or r.json().get("parameters", {}).get("retry_after", 3))
+            retry_after = int(r.headers.get("Retry-After") or orjson.loads(r.content).get("parameters", {}).get("retry_after", 3))
         except Exception:
             pass
         log.info(f"Hit Telegram rate limit; sleeping {retry_after}s")
@@ -471,8 +721,8 @@ def format_sentiment_block(s: dict) -> str:
         f"{badge} <b>{ens_score10:.2f}/10</b>",
         f"<code>Ensemble comp: {comp10:.2f}/10</code>",
     ]
-    if s.get("finbert"):
-        lines.append(f"<code>FinBERT: {html.escape(s['finbert']['label'])} {_to10(s['finbert']['score']):.2f}/10</code>")
+    if s.get("fin"):
+        lines.append(f"<code>FinDistilRoBERTa: {html.escape(s['fin']['label'])} {_to10(s['fin']['score']):.2f}/10</code>")
     if s.get("roberta"):
         lines.append(f"<code>RoBERTa: {html.escape(s['roberta']['label'])} {_to10(s['roberta']['score']):.2f}/10</code>")
     if s.get("vader"):
@@ -482,8 +732,8 @@ def format_sentiment_block(s: dict) -> str:
 def format_insights_block(url: str, body: str, title: str, summary: str) -> str:
     txt = " ".join([title or "", summary or "", body or ""]).strip()
     kw = pick_keywords(txt, limit=6)
-    read_mins = read_time_minutes(body or summary or title)
     wc = len((body or summary or title).split())
+    read_mins = read_time_minutes(wc)
     host = host_of(url)
     parts = [f"📊 <i>{host}</i> • ~{read_mins} min • {wc} words"]
     if kw:
@@ -523,114 +773,195 @@ def format_message(feed_title: str, title: str, url: str, summary: str,
 # ---------- Feed processing ----------
 async def process_feed(client_http: httpx.AsyncClient, feed_url: str) -> int:
     posted = 0
+    etag, last_modified = get_feed_meta(feed_url)
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     try:
-        r = await client_http.get(feed_url, timeout=TIMEOUT)
+        r = await client_http.get(feed_url, headers=headers)
+        if r.status_code == 304:
+            return 0  # unchanged since the last full pass
         r.raise_for_status()
-        parsed = feedparser.parse(r.content)
+        parsed = await asyncio.to_thread(feedparser.parse, r.content)  # CPU-bound; keep the loop free
     except Exception as e:
         log.warning(f"Feed fetch failed {feed_url}: {e}")
         return 0
 
     feed_title = (parsed.feed.get("title") if parsed.get("feed") else None) or feed_url
-    entries = parsed.entries or []
-    for entry in entries:
-        try:
-            key = entry_key(entry)
-            if seen_before(DB_PATH, feed_url, key):
+    entries = [(entry_key(e), e) for e in (parsed.entries or [])]
+    seen = seen_keys(feed_url, [k for k, _ in entries])
+    pending: list = []
+    failed = False  # an entry errored and was left unseen so it gets retried
+    try:
+        # Pick out unseen, recent, keyword-bearing entries first so their articles can be downloaded concurrently.
+        fresh = []
+        for key, entry in entries:
+            if key in seen:
                 continue
-
-            link = getattr(entry, "link", "") or ""
-            title = getattr(entry, "title", "") or ""
-            summary = first_nonempty(getattr(entry, "summary", ""), getattr(entry, "description", ""))
+            seen.add(key)
             pub_ts = to_unix_ts(getattr(entry, "published", None))
             if too_old(pub_ts):
-                mark_seen(DB_PATH, feed_url, key, pub_ts)
+                mark_seen(pending, feed_url, key, pub_ts)
                 continue
-
-            html_text = await fetch_text(client_http, link)
-            body = extract_fulltext(html_text, link) or ""
-
-            include, macro, crypto = matches_filters(title, summary, body)
-            hyper = bool(HYPER_REGEX.search(" ".join([title, summary, body])))
-
-            if not include and POST_ONLY_ON_STRONG_MATCH:
-                tmp_text = (title + "\n" + summary + "\n" + body)[:1200]
-                tmp_sent = sentiment_ensemble(tmp_text)
-                if (macro or crypto) and (tmp_sent["score"] >= 0.8 or tmp_sent["score"] <= 0.2):
-                    include = True
-
-            if not include:
-                log.info(json.dumps({
+            # Only download/extract articles whose headline or summary hits at least one keyword.
+            title = getattr(entry, "title", "") or ""
+            summary = first_nonempty(getattr(entry, "summary", ""), getattr(entry, "description", ""))
+            if not FILTER_REGEX.search(title + " " + summary):
+                log.info(orjson.dumps({
                     "event": "skip_item",
-                    "reason": "filter_not_matched",
+                    "reason": "prefilter_not_matched",
                     "feed": feed_url,
                     "title": title[:160]
-                }))
-                mark_seen(DB_PATH, feed_url, key, pub_ts)
+                }).decode())
+                mark_seen(pending, feed_url, key, pub_ts)
                 continue
+            fresh.append((key, entry, pub_ts))
 
-            # Sentiment (full)
-            raw_for_sent = (title + "\n" + summary + "\n" + body)[:1600]
-            sent = sentiment_ensemble(raw_for_sent)
-
-            # Tags
-            tags = []
-            if macro: tags.append("Macro")
-            if crypto: tags.append("Crypto")
-
-            msg = format_message(
-                feed_title=feed_title,
-                title=title,
-                url=link,
-                summary=first_nonempty(body, summary, title),
-                sent=sent,
-                hyper=hyper,
-                pub_ts=pub_ts,
-                tags=tags,
-                body=body,
-            )
+        htmls = await asyncio.gather(*(fetch_text(client_http, getattr(e, "link", "") or "") for _, e, _ in fresh))
 
-            await tg_send(client_http, msg)
-            posted += 1
-            mark_seen(DB_PATH, feed_url, key, pub_ts)
-            await asyncio.sleep(0.6)  # throttle Telegram to avoid 429
-        except Exception as e:
-            log.exception(f"Entry error {feed_url}: {e}")
-            await asyncio.sleep(0.5)
+        ready = []
+        for (key, entry, pub_ts), html_text in zip(fresh, htmls):
+            try:
+                link = getattr(entry, "link", "") or ""
+                title = getattr(entry, "title", "") or ""
+                summary = first_nonempty(getattr(entry, "summary", ""), getattr(entry, "description", ""))
+                body = await asyncio.to_thread(extract_fulltext, html_text, link) or ""
+                combined = "\n".join((title, summary, body))
+
+                include, macro, crypto = matches_filters(combined)
+                hyper = bool(HYPER_REGEX.search(combined))
+
+                # Weak keyword matches may still pass on strong sentiment, decided on the batched scores below
+                strong_only = not include and POST_ONLY_ON_STRONG_MATCH and (macro or crypto)
+
+                if not include and not strong_only:
+                    log.info(orjson.dumps({
+                        "event": "skip_item",
+                        "reason": "filter_not_matched",
+                        "feed": feed_url,
+                        "title": title[:160]
+                    }).decode())
+                    mark_seen(pending, feed_url, key, pub_ts)
+                    continue
+
+                ready.append((key, pub_ts, link, title, summary, body, macro, crypto, hyper, strong_only, combined))
+            except Exception as e:
+                log.exception(f"Entry error {feed_url}: {e}")
+                failed = True
+
+        # Sentiment (full), one batched inference for everything that passed the filters;
+        # in a worker thread, since transformer inference would freeze the loop for seconds
+        sents = await asyncio.to_thread(sentiment_ensemble_batch, [combined[:1600] for *_, combined in ready])
+
+        for (key, pub_ts, link, title, summary, body, macro, crypto, hyper, strong_only, _), sent in zip(ready, sents):
+            try:
+                if strong_only and 0.2 < sent["score"] < 0.8:
+                    log.info(orjson.dumps({
+                        "event": "skip_item",
+                        "reason": "filter_not_matched",
+                        "feed": feed_url,
+                        "title": title[:160]
+                    }).decode())
+                    mark_seen(pending, feed_url, key, pub_ts)
+                    continue
+
+                # Tags
+                tags = []
+                if macro: tags.append("Macro")
+                if crypto: tags.append("Crypto")
+
+                msg = format_message(
+                    feed_title=feed_title,
+                    title=title,
+                    url=link,
+                    summary=first_nonempty(body, summary, title),
+                    sent=sent,
+                    hyper=hyper,
+                    pub_ts=pub_ts,
+                    tags=tags,
+                    body=body,
+                )
+
+                await tg_send(client_http, msg)
+                posted += 1
+                mark_seen(pending, feed_url, key, pub_ts)
+            except Exception as e:
+                log.exception(f"Entry error {feed_url}: {e}")
+                failed = True
+                await asyncio.sleep(0.5)
+
+        # Only remember validators once every entry was handled; otherwise a 304 would hide
+        # the failed entries until the feed changes, instead of retrying them next cycle.
+        new_etag, new_last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+        if not failed and (new_etag, new_last_modified) != (etag, last_modified):
+            save_feed_meta(feed_url, new_etag, new_last_modified)
+    finally:
+        flush_seen(pending)
     return posted
 
-async def run_loop():
-    init_db(DB_PATH)
-    log.info(f"Starting. Feeds: {len(FEEDS)} | poll every {POLL_SECONDS}s | chat={CHAT_ID} topic={THREAD_ID or '-'}")
-    async with httpx.AsyncClient(
-        headers={"User-Agent": "WildmetaMacroCryptoBot/2.5"},
-        follow_redirects=True,  # important for 301/302/308
-    ) as client:
-        # Warm HF models (optional)
+async def run_cycle(client: httpx.AsyncClient) -> int:
+    """Process every feed concurrently (bounded by FEED_CONCURRENCY); returns total posted."""
+    async def bounded(feed: str) -> int:
+        async with _feed_sem:
+            return await process_feed(client, feed)
+
+    results = await asyncio.gather(*(bounded(f) for f in FEEDS), return_exceptions=True)
+    total = 0
+    for feed, res in zip(FEEDS, results):
+        if isinstance(res, Exception):
+            log.warning(f"Feed pass failed {feed}: {res}")
+        elif res:
+            log.info(f"Posted {res} from {feed}")
+            total += res
+    return total
+
+async def prune_seen_periodically() -> None:
+    # init_db just loaded the Bloom filter, so the first prune waits a full interval
+    while True:
+        await asyncio.sleep(SEEN_PRUNE_EVERY)
         try:
-            load_hf_models()
-            log.info("Loaded HF sentiment models.")
+            deleted = await asyncio.to_thread(prune_seen, SEEN_RETENTION_DAYS)
+            log.info(orjson.dumps({"event": "seen_pruned", "deleted": deleted, "retention_days": SEEN_RETENTION_DAYS}).decode())
         except Exception as e:
-            log.warning(f"Could not pre-load HF models (will fallback if needed): {e}")
+            log.warning(f"Pruning seen table failed: {e}")
 
-        # initial pass
-        for feed in FEEDS:
+async def run_loop():
+    global _feed_sem, _host_sems
+    init_db(DB_PATH)
+    _feed_sem = asyncio.Semaphore(FEED_CONCURRENCY)
+    _host_sems = {}
+    log.info(f"Starting. Feeds: {len(FEEDS)} | poll every {POLL_SECONDS}s | chat={CHAT_ID} topic={THREAD_ID or '-'}")
+    pruner = asyncio.create_task(prune_seen_periodically())
+    try:
+        async with httpx.AsyncClient(
+            headers={"User-Agent": "WildmetaMacroCryptoBot/2.5"},
+            follow_redirects=True,  # important for 301/302/308
+            http2=True,             # multiplex article GETs to the same origin over one connection
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0),
+            timeout=httpx.Timeout(TIMEOUT, connect=5.0),
+        ) as client:
+            # Warm HF models (optional) off the event loop; an ONNX export can take minutes
             try:
-                cnt = await process_feed(client, feed)
-                if cnt:
-                    log.info(f"Posted {cnt} from {feed}")
+                await asyncio.to_thread(load_hf_models)
+                log.info("Loaded HF sentiment models.")
             except Exception as e:
-                log.warning(f"Feed pass failed {feed}: {e}")
-
-        # loop forever
-        while True:
-            start = time.time()
-            total = 0
-            for feed in FEEDS:
-                total += await process_feed(client, feed)
-            dur = time.time() - start
-            log.info(json.dumps({"event":"cycle_done","posted":total,"duration_s":round(dur,2)}))
-            await asyncio.sleep(POLL_SECONDS)
+                log.warning(f"Could not pre-load HF models (will fallback if needed): {e}")
+            await asyncio.to_thread(load_fallback_model)
+
+            # initial pass
+            await run_cycle(client)
+
+            # loop forever
+            while True:
+                start = time.time()
+                total = await run_cycle(client)
+                dur = time.time() - start
+                log.info(orjson.dumps({"event":"cycle_done","posted":total,"duration_s":round(dur,2)}).decode())
+                await asyncio.sleep(POLL_SECONDS)
+    finally:
+        pruner.cancel()
 
 def main():
     try:
@@ -0,0 +1,26 @@
+"""
+Telegram flood-limit buckets shared by the Wildmeta bots.
+
+Both bots send through the same bot token and usually into the same group, so
+when the manager runs them in one process they must draw from one set of
+buckets. Each bot keeping its own would double the real send rate.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+from aiolimiter import AsyncLimiter
+
+# ~30 msg/s per bot token overall
+TG_LIMITER = AsyncLimiter(28, 1)
+
+@lru_cache(maxsize=None)
+def chat_limiters(chat_id: str) -> Tuple[AsyncLimiter, AsyncLimiter]:
+    """
+    Return the (per-second, per-minute) limiters for one chat.
+
+    Any chat takes at most 1 msg/s; groups and channels (negative IDs) are
+    additionally capped at 20 msg/min. Callers enter both, per-second first.
+    """
+    per_minute = AsyncLimiter(20, 60) if chat_id.startswith("-") else AsyncLimiter(60, 60)
+    return AsyncLimiter(1, 1), per_minute
@@ -17,18 +17,26 @@ import asyncio
 import signal
 import logging
 import argparse
+import atexit
 import json
+import queue
+import re
 import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timezone
 from typing import Optional, List, Dict
 from concurrent.futures import ThreadPoolExecutor
 import threading
 from pathlib import Path
 
-# Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
-# Import both bot modules
+# Import both bot modules (the script's own directory is already sys.path[0])
 try:
     import rss_macro_crypto_bot
     import wildmeta_x_feed_bot
@@ -45,44 +53,121 @@ load_dotenv()
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
+# Banner rules shared by the manager log and CLI output
+_EQ60 = "=" * 60
+_DASH60 = "-" * 60
+
+# Held (flock/msvcrt) for as long as a manager runs; a stale file means nothing
+LOCK_FILE = ".manager.lock"
+
+# Bot databases (relative to the working directory)
+RSS_DB = "bot.db"
+X_DB = "x_bot.db"
+
+# A bot that ran this long before crashing starts its restart backoff over
+RESTART_BACKOFF_RESET = 300
+
 # ---------- Logging Setup ----------
+_RSS_NAME = "macro-crypto-bot"
+_X_NAME = "wildmeta-x-bot"
+_CYCLE_RE = re.compile(r"cycle_(?:done|complete)").search
+
 class BotLogHandler(logging.Handler):
     """Custom log handler to track bot status and errors."""
     
     def __init__(self):
         super().__init__()
-        self.rss_errors = []
-        self.x_errors = []
-        self.rss_last_activity = None
-        self.x_last_activity = None
+        # Keep only last 10 errors
+        self.rss_errors = deque(maxlen=10)
+        self.x_errors = deque(maxlen=10)
+        # Epoch floats straight from record.created; formatted only when read
+        self.rss_last_activity: Optional[float] = None
+        self.x_last_activity: Optional[float] = None
         
     def emit(self, record):
+        # The listener hands us every queued record, manager ones included
+        name = record.name
+        is_rss = name == _RSS_NAME
+        is_x = name == _X_NAME
+        if not (is_rss or is_x):
+            return
+        
         # Track errors
         if record.levelno >= logging.ERROR:
-            if "macro-crypto-bot" in record.name:
-                self.rss_errors.append({
-                    "time": datetime.now(timezone.utc).isoformat(),
-                    "message": record.getMessage()
-                })
-                # Keep only last 10 errors
-                self.rss_errors = self.rss_errors[-10:]
-            elif "wildmeta-x-bot" in record.name:
-                self.x_errors.append({
-                    "time": datetime.now(timezone.utc).isoformat(),
-                    "message": record.getMessage()
-                })
-                self.x_errors = self.x_errors[-10:]
+            entry = {"time": record.created, "message": record.getMessage()}
+            (self.rss_errors if is_rss else self.x_errors).append(entry)
         
-        # Track activity
-        if "cycle_done" in record.getMessage() or "cycle_complete" in record.getMessage():
-            if "macro-crypto-bot" in record.name:
-                self.rss_last_activity = datetime.now(timezone.utc)
-            elif "wildmeta-x-bot" in record.name:
-                self.x_last_activity = datetime.now(timezone.utc)
+        # Track activity (bots log the marker literally, so the raw msg is enough)
+        elif isinstance(record.msg, str) and _CYCLE_RE(record.msg):
+            if is_rss:
+                self.rss_last_activity = record.created
+            else:
+                self.x_last_activity = record.created
 
 # Global log handler for monitoring
 bot_log_handler = BotLogHandler()
 
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+    
+    def __init__(self, q):
+        super().__init__(q)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                sys.stderr.write(f"[log] queue full, dropped {self.dropped} records so far\n")
+
+class BufferedFileHandler(logging.StreamHandler):
+    """File handler with a 64 KiB write buffer; flushed by the listener, not per record."""
+    
+    def __init__(self, path, encoding='utf-8'):
+        super().__init__(open(path, 'a', encoding=encoding, buffering=64 * 1024))
+    
+    def flush(self):
+        pass
+    
+    def flush_buffer(self):
+        with self.lock:
+            self.stream.flush()
+    
+    def close(self):
+        with self.lock:
+            if not self.stream.closed:
+                self.stream.flush()
+                self.stream.close()
+        super().close()
+
+class LogListener(QueueListener):
+    """QueueListener that flushes file buffers whenever it drains the queue."""
+    
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, BufferedFileHandler):
+                    handler.flush_buffer()
+    
+    def enqueue_sentinel(self):
+        # Wait for room rather than failing when stop() hits a full queue
+        self.queue.put(self._sentinel)
+
+# Bot loggers only enqueue records; a single listener thread owns the console/file
+# handlers so disk writes never block the event loop. The queue is bounded so a
+# stalled disk costs dropped lines, not unbounded memory.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=10000)
+_queue_handler = DroppingQueueHandler(_log_queue)
+_console_handler = logging.StreamHandler()
+_console_handler.setLevel(logging.INFO)
+_log_listener = LogListener(_log_queue, bot_log_handler, _console_handler,
+                            respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 def setup_logging(name: str, log_file: str) -> logging.Logger:
     """Set up logging for each bot with file and console output."""
     logger = logging.getLogger(name)
@@ -90,27 +175,27 @@ def setup_logging(name: str, log_file: str) -> logging.Logger:
     
     # Clear existing handlers
     logger.handlers = []
+    logger.propagate = False
     
-    # File handler
-    file_handler = logging.FileHandler(LOG_DIR / log_file, encoding='utf-8')
+    # File handler, run by the listener thread and limited to this logger's records
+    file_handler = BufferedFileHandler(LOG_DIR / log_file, encoding='utf-8')
     file_handler.setLevel(logging.INFO)
     file_formatter = logging.Formatter(
         '%(asctime)s | %(name)s | %(levelname)s | %(message)s'
     )
     file_handler.setFormatter(file_formatter)
+    file_handler.addFilter(logging.Filter(name))
+    _log_listener.handlers += (file_handler,)
     
-    # Console handler with color coding
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    
-    # Add custom handler for monitoring
-    logger.addHandler(bot_log_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(_queue_handler)
     
     return logger
 
 # ---------- Bot Manager Class ----------
+def _iso(ts: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat() if ts else None
+
+
 class BotManager:
     """Manages multiple bot processes with monitoring and control."""
     
@@ -121,20 +206,21 @@ class BotManager:
         self.rss_enabled = True
         self.x_enabled = True
         self.start_time = datetime.now(timezone.utc)
+        self._start_monotonic = time.monotonic()
+        self._crash_count = {"rss": 0, "x": 0}
+        self._db_check_ts = 0.0
+        self._db_exists: Dict[str, bool] = {}
         
         # Setup loggers
-        self.rss_logger = setup_logging("macro-crypto-bot", "rss_bot.log")
-        self.x_logger = setup_logging("wildmeta-x-bot", "x_bot.log")
+        self.rss_logger = setup_logging(_RSS_NAME, "rss_bot.log")
+        self.x_logger = setup_logging(_X_NAME, "x_bot.log")
         self.manager_logger = setup_logging("bot-manager", "manager.log")
         
     async def run_rss_bot(self):
         """Run the RSS bot in its own async context."""
         self.manager_logger.info("Starting RSS Macro/Crypto Bot...")
         try:
-            # Monkey-patch the logger in the RSS bot module
-            rss_macro_crypto_bot.log = self.rss_logger
-            
-            # Run the RSS bot
+            # Run the RSS bot; its module-level log is the logger set up above
             await rss_macro_crypto_bot.run_loop()
         except asyncio.CancelledError:
             self.manager_logger.info("RSS bot cancelled")
@@ -147,10 +233,7 @@ class BotManager:
         """Run the X bot in its own async context."""
         self.manager_logger.info("Starting X Feed Bot...")
         try:
-            # Monkey-patch the logger in the X bot module
-            wildmeta_x_feed_bot.log = self.x_logger
-            
-            # Run the X bot
+            # Run the X bot; its module-level log is the logger set up above
             await wildmeta_x_feed_bot.run_loop()
         except asyncio.CancelledError:
             self.manager_logger.info("X bot cancelled")
@@ -159,55 +242,62 @@ class BotManager:
             self.manager_logger.error(f"X bot crashed: {e}")
             raise
     
-    async def health_monitor(self):
-        """Monitor bot health and restart if needed."""
-        while not self.shutdown_event.is_set():
+    async def _supervise(self, kind: str):
+        """
+        Run a bot, restarting it with exponential backoff (2s, 4s, ... up to 60s) if it crashes.
+        The backoff resets once the bot has stayed up for RESTART_BACKOFF_RESET seconds.
+        """
+        run = self.run_rss_bot if kind == "rss" else self.run_x_bot
+        name = "RSS" if kind == "rss" else "X"
+        while True:
+            started = time.monotonic()
             try:
-                await asyncio.sleep(60)  # Check every minute
-                
-                # Check RSS bot
-                if self.rss_enabled and self.rss_task:
-                    if self.rss_task.done():
-                        exception = self.rss_task.exception()
-                        if exception:
-                            self.manager_logger.error(f"RSS bot died with exception: {exception}")
-                            self.manager_logger.info("Restarting RSS bot...")
-                            self.rss_task = asyncio.create_task(self.run_rss_bot())
-                
-                # Check X bot
-                if self.x_enabled and self.x_task:
-                    if self.x_task.done():
-                        exception = self.x_task.exception()
-                        if exception:
-                            self.manager_logger.error(f"X bot died with exception: {exception}")
-                            self.manager_logger.info("Restarting X bot...")
-                            self.x_task = asyncio.create_task(self.run_x_bot())
-                            
-            except Exception as e:
-                self.manager_logger.error(f"Health monitor error: {e}")
-                
+                await run()
+                return
+            except Exception as exception:
+                if time.monotonic() - started >= RESTART_BACKOFF_RESET:
+                    self._crash_count[kind] = 0
+                self._crash_count[kind] += 1
+                delay = min(2 ** self._crash_count[kind], 60)
+                self.manager_logger.error(f"{name} bot died with exception: {exception}")
+                self.manager_logger.info(f"Restarting {name} bot in {delay}s...")
+                await asyncio.sleep(delay)
+    
+    def _db_files(self) -> Dict[str, bool]:
+        """Which bot databases exist; refreshed by one directory scan at most once a second."""
+        now = time.monotonic()
+        if now - self._db_check_ts > 1.0:
+            with os.scandir(".") as it:
+                names = {e.name for e in it}
+            self._db_exists = {db: db in names for db in (RSS_DB, X_DB)}
+            self._db_check_ts = now
+        return self._db_exists
+    
     def get_status(self) -> Dict:
         """Get current status of all bots."""
-        uptime = datetime.now(timezone.utc) - self.start_time
+        secs = int(time.monotonic() - self._start_monotonic)
+        hours, rem = divmod(secs, 3600)
+        mins, secs = divmod(rem, 60)
+        dbs = self._db_files()
         
         status = {
             "manager": {
-                "uptime": str(uptime).split('.')[0],
+                "uptime": f"{hours}:{mins:02d}:{secs:02d}",
                 "start_time": self.start_time.isoformat(),
             },
             "rss_bot": {
                 "enabled": self.rss_enabled,
                 "running": self.rss_task and not self.rss_task.done() if self.rss_task else False,
-                "last_activity": bot_log_handler.rss_last_activity.isoformat() if bot_log_handler.rss_last_activity else None,
+                "last_activity": _iso(bot_log_handler.rss_last_activity),
                 "recent_errors": len(bot_log_handler.rss_errors),
-                "database": os.path.exists("bot.db")
+                "database": dbs[RSS_DB]
             },
             "x_bot": {
                 "enabled": self.x_enabled,
                 "running": self.x_task and not self.x_task.done() if self.x_task else False,
-                "last_activity": bot_log_handler.x_last_activity.isoformat() if bot_log_handler.x_last_activity else None,
+                "last_activity": _iso(bot_log_handler.x_last_activity),
                 "recent_errors": len(bot_log_handler.x_errors),
-                "database": os.path.exists("x_bot.db")
+                "database": dbs[X_DB]
             }
         }
         
@@ -215,9 +305,9 @@ class BotManager:
     
     async def start(self, rss_only=False, x_only=False):
         """Start the bot manager and selected bots."""
-        self.manager_logger.info("=" * 60)
+        self.manager_logger.info(_EQ60)
         self.manager_logger.info("   Wildmeta Intelligence Suite - Bot Manager")
-        self.manager_logger.info("=" * 60)
+        self.manager_logger.info(_EQ60)
         
         # Determine which bots to run
         if rss_only:
@@ -229,100 +319,95 @@ class BotManager:
         else:
             self.manager_logger.info("Mode: Both Bots")
         
-        # Start selected bots
-        tasks = []
-        
-        if self.rss_enabled:
-            self.rss_task = asyncio.create_task(self.run_rss_bot())
-            tasks.append(self.rss_task)
-            self.manager_logger.info("✓ RSS Macro/Crypto Bot scheduled")
-        
-        if self.x_enabled:
-            self.x_task = asyncio.create_task(self.run_x_bot())
-            tasks.append(self.x_task)
-            self.manager_logger.info("✓ X Feed Bot scheduled")
-        
-        # Start health monitor
-        monitor_task = asyncio.create_task(self.health_monitor())
-        tasks.append(monitor_task)
-        self.manager_logger.info("✓ Health monitor started")
-        
-        self.manager_logger.info("-" * 60)
-        self.manager_logger.info("All systems operational. Press Ctrl+C to stop.")
-        self.manager_logger.info(f"Logs directory: {LOG_DIR.absolute()}")
-        self.manager_logger.info("-" * 60)
-        
-        # Wait for shutdown or task completion
-        try:
-            await self.shutdown_event.wait()
-        except KeyboardInterrupt:
-            self.manager_logger.info("\nShutdown signal received...")
-        
-        # Cancel all tasks
-        self.manager_logger.info("Stopping all bots...")
-        for task in tasks:
-            if task and not task.done():
-                task.cancel()
-        
-        # Wait for tasks to complete cancellation
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Bots (and their restarts) live inside one task group; leaving it waits for them
+        async with asyncio.TaskGroup() as tg:
+            if self.rss_enabled:
+                self.rss_task = tg.create_task(self._supervise("rss"))
+                self.manager_logger.info("✓ RSS Macro/Crypto Bot scheduled")
+            
+            if self.x_enabled:
+                self.x_task = tg.create_task(self._supervise("x"))
+                self.manager_logger.info("✓ X Feed Bot scheduled")
+            
+            self.manager_logger.info(_DASH60)
+            self.manager_logger.info("All systems operational. Press Ctrl+C to stop.")
+            self.manager_logger.info(f"Logs directory: {LOG_DIR.absolute()}")
+            self.manager_logger.info(_DASH60)
+            
+            # Wait for shutdown
+            try:
+                await self.shutdown_event.wait()
+            except KeyboardInterrupt:
+                self.manager_logger.info("\nShutdown signal received...")
+            
+            # Cancel all tasks
+            self.manager_logger.info("Stopping all bots...")
+            for task in (self.rss_task, self.x_task):
+                if task:
+                    task.cancel()
         
         self.manager_logger.info("All bots stopped successfully.")
         
-    async def shutdown(self):
-        """Trigger graceful shutdown."""
+    def shutdown(self):
+        """Trigger graceful shutdown: start() cancels the bots once the event is set."""
         self.shutdown_event.set()
 
 # ---------- Signal Handlers ----------
 manager_instance: Optional[BotManager] = None
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals."""
-    print("\n[Manager] Received shutdown signal...")
-    if manager_instance:
-        asyncio.create_task(manager_instance.shutdown())
+def install_signal_handlers(manager: BotManager):
+    """Call manager.shutdown() on SIGINT/SIGTERM from inside the event loop."""
+    loop = asyncio.get_running_loop()
 
-# ---------- CLI Commands ----------
-def check_status():
-    """Check and display bot status."""
-    print("\n" + "=" * 60)
-    print("   Wildmeta Bot Status")
-    print("=" * 60)
-    
-    # Check if manager is running by looking for lock file
-    lock_file = Path(".manager.lock")
-    if lock_file.exists():
-        print("✓ Bot Manager: RUNNING")
-    else:
-        print("✗ Bot Manager: NOT RUNNING")
-    
-    # Check databases
-    print("\nDatabases:")
-    if Path("bot.db").exists():
-        size = Path("bot.db").stat().st_size / 1024
-        print(f"  ✓ RSS Bot DB: {size:.1f} KB")
-    else:
-        print("  ✗ RSS Bot DB: Not found")
-    
-    if Path("x_bot.db").exists():
-        size = Path("x_bot.db").stat().st_size / 1024
-        print(f"  ✓ X Bot DB: {size:.1f} KB")
+    def on_signal():
+        print("\n[Manager] Received shutdown signal...")
+        manager.shutdown()
+
+    signals = [signal.SIGINT]
+    if sys.platform != "win32":
+        signals.append(signal.SIGTERM)
+    for sig in signals:
+        try:
+            loop.add_signal_handler(sig, on_signal)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(on_signal))
+
+# ---------- Instance Lock ----------
+def try_lock(fd: int, shared: bool = False) -> bool:
+    """Take a non-blocking advisory lock on fd; False if another process holds it."""
+    try:
+        if fcntl:
+            fcntl.flock(fd, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+def unlock(fd: int):
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_UN)
     else:
-        print("  ✗ X Bot DB: Not found")
-    
-    # Check log files
-    print("\nLog Files:")
-    if LOG_DIR.exists():
-        for log_file in LOG_DIR.glob("*.log"):
-            size = log_file.stat().st_size / 1024
-            modified = datetime.fromtimestamp(log_file.stat().st_mtime)
-            print(f"  • {log_file.name}: {size:.1f} KB (modified: {modified.strftime('%Y-%m-%d %H:%M')})")
-    
-    print("\n" + "=" * 60)
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
 
-def display_help():
-    """Display detailed help information."""
-    help_text = """
+def manager_running() -> bool:
+    """True if another process currently holds the manager lock."""
+    try:
+        fd = os.open(LOCK_FILE, os.O_RDWR)
+    except FileNotFoundError:
+        return False
+    try:
+        if not try_lock(fd, shared=True):
+            return True
+        unlock(fd)
+        return False
+    finally:
+        os.close(fd)
+
+# ---------- CLI Commands ----------
+_HELP_TEXT = """
 ╔══════════════════════════════════════════════════════════════╗
 ║           Wildmeta Intelligence Suite - Bot Manager          ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -362,7 +447,46 @@ MONITORING:
 STOPPING:
     Press Ctrl+C to gracefully stop all bots.
     """
-    print(help_text)
+
+
+def check_status():
+    """Check and display bot status."""
+    print("\n" + _EQ60)
+    print("   Wildmeta Bot Status")
+    print(_EQ60)
+    
+    # Check if manager is running by probing its lock
+    if manager_running():
+        print("✓ Bot Manager: RUNNING")
+    else:
+        print("✗ Bot Manager: NOT RUNNING")
+    
+    # Check databases
+    print("\nDatabases:")
+    with os.scandir(".") as it:
+        db_entries = {e.name: e for e in it if e.name in (RSS_DB, X_DB)}
+    for label, db in (("RSS Bot DB", RSS_DB), ("X Bot DB", X_DB)):
+        entry = db_entries.get(db)
+        if entry:
+            print(f"  ✓ {label}: {entry.stat().st_size / 1024:.1f} KB")
+        else:
+            print(f"  ✗ {label}: Not found")
+    
+    # Check log files
+    print("\nLog Files:")
+    if LOG_DIR.exists():
+        with os.scandir(LOG_DIR) as it:
+            log_files = sorted((e for e in it if e.name.endswith(".log")), key=lambda e: e.name)
+        for entry in log_files:
+            st = entry.stat()
+            print(f"  • {entry.name}: {st.st_size / 1024:.1f} KB "
+                  f"(modified: {datetime.fromtimestamp(st.st_mtime):%Y-%m-%d %H:%M})")
+    
+    print("\n" + _EQ60)
+
+def display_help():
+    """Display detailed help information."""
+    print(_HELP_TEXT)
 
 # ---------- Main Entry Point ----------
 async def main():
@@ -398,29 +522,41 @@ async def main():
         print("See config.template for an example.")
         sys.exit(1)
     
-    # Create and configure manager
-    manager_instance = BotManager()
-    
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    if sys.platform != "win32":
-        signal.signal(signal.SIGTERM, signal_handler)
-    
-    # Create lock file to indicate manager is running
-    lock_file = Path(".manager.lock")
-    lock_file.touch()
+    # Lock file to indicate manager is running (and keep a second one from starting)
+    lock_fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    if not try_lock(lock_fd):
+        os.close(lock_fd)
+        print("ERROR: Bot manager is already running.")
+        sys.exit(1)
+    os.ftruncate(lock_fd, 0)
+    os.write(lock_fd, str(os.getpid()).encode())
     
     try:
+        # Create and configure manager
+        manager_instance = BotManager()
+        
+        # Set up signal handlers
+        install_signal_handlers(manager_instance)
+        
         # Start the manager
         await manager_instance.start(rss_only=args.rss, x_only=args.x)
     finally:
-        # Clean up lock file
-        if lock_file.exists():
-            lock_file.unlink()
+        # Closing the descriptor releases the lock; the file itself is left in place
+        unlock(lock_fd)
+        os.close(lock_fd)
+
+def run():
+    """Run main(), with eager task execution on Python 3.12+."""
+    if sys.version_info >= (3, 12):
+        with asyncio.Runner() as runner:
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            runner.run(main())
+    else:
+        asyncio.run(main())
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run()
     except KeyboardInterrupt:
         print("\n[Manager] Shutdown complete.")
     except Exception as e:
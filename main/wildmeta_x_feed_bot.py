@@ -5,29 +5,35 @@ Wildmeta X (Twitter) → Telegram Bot
 Fetches latest posts from @wildmetaHQ and posts them to Telegram with embeds.
 
 Setup:
-  pip install httpx beautifulsoup4 python-dotenv tenacity aiofiles
+  pip install "httpx[http2,brotli,zstd]" aiolimiter beautifulsoup4 lxml orjson python-dotenv tenacity aiofiles
   
 .env additions:
   BOT_TOKEN=xxxxxxxx:yyyyyyyyyyyyyyyyyyyyyyyyyyyyyyyyyyy
   CHAT_ID=-1002918297497
   X_THREAD_ID=711
   X_POLL_SECONDS=300
+  X_MAX_POLL_SECONDS=1800
   X_DB_PATH=./x_bot.db
   X_USERNAME=wildmetaHQ
   X_MAX_POSTS_PER_CYCLE=5
 """
 
 from __future__ import annotations
-import os, time, json, sqlite3, asyncio, hashlib, logging, html, re
+import os, time, json, sqlite3, asyncio, hashlib, logging, html, re, threading
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Tuple
 from urllib.parse import urlparse, quote
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from tenacity import retry, stop_after_attempt, wait_exponential
 from dotenv import load_dotenv
 
+from telegram_limits import TG_LIMITER, chat_limiters
+
 # ---------- Configuration ----------
 load_dotenv()
 
@@ -36,6 +42,7 @@ BOT_TOKEN = os.getenv("BOT_TOKEN")
 CHAT_ID = os.getenv("CHAT_ID", "-1002918297497")
 X_THREAD_ID = os.getenv("X_THREAD_ID", "711")  # X posts topic
 POLL_SECONDS = int(os.getenv("X_POLL_SECONDS", "300"))  # 5 minutes default
+MAX_POLL_SECONDS = int(os.getenv("X_MAX_POLL_SECONDS", "1800"))  # backoff cap when quiet
 DB_PATH = os.getenv("X_DB_PATH", "./x_bot.db")
 
 # X/Twitter configuration
@@ -56,50 +63,145 @@ logging.basicConfig(
 log = logging.getLogger("wildmeta-x-bot")
 
 # ---------- Database ----------
-def init_db(path: str) -> None:
-    """Initialize SQLite database for tracking seen X posts."""
-    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    conn = sqlite3.connect(path)
-    cur = conn.cursor()
-    cur.executescript("""
-    PRAGMA journal_mode=WAL;
-    CREATE TABLE IF NOT EXISTS x_posts (
-      post_id TEXT PRIMARY KEY,
+# Single connection opened by init_db and reused for every lookup/write.
+_conn: Optional[sqlite3.Connection] = None
+# Writes run in worker threads (asyncio.to_thread); serialize access to the connection
+_DB_LOCK = threading.Lock()
+# Run a PASSIVE WAL checkpoint every this many cycles (never FULL, which can stall)
+CHECKPOINT_EVERY_CYCLES = 12
+
+# Recently seen post IDs, checked before SQLite (oldest first)
+SEEN_LRU_SIZE = 1000
+_seen_lru: "OrderedDict[int, None]" = OrderedDict()
+
+def _remember(post_id: int) -> None:
+    _seen_lru[post_id] = None
+    _seen_lru.move_to_end(post_id)
+    if len(_seen_lru) > SEEN_LRU_SIZE:
+        _seen_lru.popitem(last=False)
+
+_X_POSTS_COLUMNS = """
+      post_id INTEGER PRIMARY KEY,
       username TEXT NOT NULL,
       content TEXT,
       posted_at INTEGER,
       first_seen_ts INTEGER NOT NULL,
       telegram_msg_id INTEGER
-    );
-    CREATE INDEX IF NOT EXISTS idx_username ON x_posts(username);
-    CREATE INDEX IF NOT EXISTS idx_posted_at ON x_posts(posted_at);
+"""
+
+def _migrate_post_id_to_integer(conn: sqlite3.Connection) -> bool:
+    """Rebuild an x_posts table that still stores post_id as TEXT.
+
+    Snowflake IDs fit in a 64-bit INTEGER, which makes post_id the rowid alias
+    instead of a separate TEXT index. Non-numeric IDs are dropped in the copy.
+    Returns True if the table was rebuilt.
+    """
+    cols = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(x_posts)")}
+    if cols.get("post_id", "INTEGER").upper() == "INTEGER":
+        return False
+    log.info("Migrating x_posts.post_id from %s to INTEGER", cols["post_id"])
+    conn.executescript(f"""
+    BEGIN;
+    DROP TABLE IF EXISTS x_posts_v2;
+    CREATE TABLE x_posts_v2 ({_X_POSTS_COLUMNS});
+    INSERT OR REPLACE INTO x_posts_v2
+      SELECT CAST(post_id AS INTEGER), username, content, posted_at, first_seen_ts, telegram_msg_id
+      FROM x_posts WHERE post_id <> '' AND post_id NOT GLOB '*[^0-9]*';
+    DROP TABLE x_posts;
+    ALTER TABLE x_posts_v2 RENAME TO x_posts;
+    COMMIT;
     """)
-    conn.commit()
-    conn.close()
+    return True
 
-def seen_before(path: str, post_id: str) -> bool:
-    """Check if we've seen this X post before."""
-    conn = sqlite3.connect(path)
+def init_db(path: str) -> None:
+    """Open the shared SQLite connection and create the schema for tracking seen X posts."""
+    global _conn
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    close_db()
+    conn = sqlite3.connect(path, check_same_thread=False)
     cur = conn.cursor()
-    cur.execute("SELECT 1 FROM x_posts WHERE post_id=? LIMIT 1", (post_id,))
-    row = cur.fetchone()
-    conn.close()
-    return row is not None
+    cur.executescript("""
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=10737418240;
+    PRAGMA busy_timeout=3000;
+    """)
+    changed = _migrate_post_id_to_integer(conn)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS x_posts ({_X_POSTS_COLUMNS})")
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    if "idx_username" in indexes:
+        # One-time switch to the (username, posted_at) index below
+        conn.execute("DROP INDEX idx_username")
+        changed = True
+    # Indexes are (re)created after any migration, since dropping the old table drops them too
+    if not {"idx_username_posted", "idx_posted_at"} <= indexes:
+        cur.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_username_posted ON x_posts(username, posted_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_posted_at ON x_posts(posted_at);
+        """)
+        changed = True
+    conn.commit()
+    # Full statistics only after a schema change; otherwise let SQLite decide what needs refreshing
+    conn.execute("ANALYZE" if changed else "PRAGMA optimize")
+    _conn = conn
+    
+    # Warm the LRU with the most recent posts
+    _seen_lru.clear()
+    rows = conn.execute(
+        "SELECT post_id FROM x_posts ORDER BY first_seen_ts DESC LIMIT ?", (SEEN_LRU_SIZE,)
+    ).fetchall()
+    for (post_id,) in reversed(rows):
+        _seen_lru[post_id] = None
+
+def close_db() -> None:
+    """Close the shared SQLite connection, if open."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+def seen_ids(post_ids: List[str]) -> set:
+    """Return the subset of post_ids we've seen before, querying SQLite only for LRU misses."""
+    known = {pid for pid in post_ids if int(pid) in _seen_lru}
+    misses = {int(pid): pid for pid in post_ids if pid not in known}
+    if not misses:
+        return known
+    placeholders = ",".join("?" * len(misses))
+    with _DB_LOCK:
+        rows = _conn.execute(
+            f"SELECT post_id FROM x_posts WHERE post_id IN ({placeholders})", list(misses)
+        ).fetchall()
+    for (post_id,) in rows:
+        _remember(post_id)
+        known.add(misses[post_id])
+    return known
 
-def mark_seen(path: str, post_id: str, username: str, 
+def mark_seen(pending: list, post_id: str, username: str, 
               content: str, posted_at: Optional[int], 
               telegram_msg_id: Optional[int] = None) -> None:
-    """Mark an X post as seen and store its details."""
-    conn = sqlite3.connect(path)
-    cur = conn.cursor()
-    cur.execute(
-        """INSERT OR REPLACE INTO x_posts
-           (post_id, username, content, posted_at, first_seen_ts, telegram_msg_id) 
-           VALUES (?,?,?,?,?,?)""",
-        (post_id, username, content, posted_at, int(time.time()), telegram_msg_id)
-    )
-    conn.commit()
-    conn.close()
+    """Queue an X post's details to be stored as seen by flush_seen."""
+    pending.append((int(post_id), username, content, posted_at, int(time.time()), telegram_msg_id))
+
+def flush_seen(rows: list) -> None:
+    """Store queued X posts in one transaction with a single prepared statement."""
+    if not rows:
+        return
+    with _DB_LOCK, _conn:
+        _conn.executemany(
+            """INSERT OR REPLACE INTO x_posts
+               (post_id, username, content, posted_at, first_seen_ts, telegram_msg_id) 
+               VALUES (?,?,?,?,?,?)""",
+            rows
+        )
+    for row in rows:
+        _remember(row[0])
+
+def checkpoint_db() -> None:
+    """Fold the WAL back into the database without blocking readers or writers."""
+    with _DB_LOCK:
+        _conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
 
 # ---------- X/Twitter Scraping ----------
 class XPost:
@@ -118,118 +220,224 @@ class XPost:
         self.metrics = metrics or {}
         self.url = f"https://x.com/{username}/status/{post_id}"
 
-async def fetch_x_posts_nitter(client: httpx.AsyncClient, username: str) -> List[XPost]:
+NITTER_INSTANCES = [
+    "https://nitter.privacydev.net",
+    "https://nitter.poast.org", 
+    "https://nitter.cz",
+    "https://nitter.net",
+]
+
+# Nitter timeline selectors, compiled once
+_ONLY_TIMELINE_ITEMS = SoupStrainer('div', class_='timeline-item')
+_SEL_ITEM = sv.compile('.timeline-item')
+_SEL_LINK = sv.compile('.tweet-link')
+_SEL_CONTENT = sv.compile('.tweet-content')
+_SEL_DATE = sv.compile('.tweet-date a')
+_SEL_IMAGES = sv.compile('.attachment-image img')
+_SEL_STATS = sv.compile('.tweet-stat')
+_SEL_ICON = sv.compile('.icon-container')
+_SEL_STAT_VALUE = sv.compile('.tweet-stat-value')
+_RE_STATUS = re.compile(r'/status/(\d+)')
+
+def parse_nitter_timeline(page: str, username: str) -> List[XPost]:
     """
-    Fetch X posts using Nitter instances (privacy-focused Twitter frontend).
-    Falls back through multiple instances if needed.
+    Parse the posts out of a Nitter timeline page.
     """
-    nitter_instances = [
-        "https://nitter.privacydev.net",
-        "https://nitter.poast.org", 
-        "https://nitter.cz",
-        "https://nitter.net",
-    ]
-    
     posts = []
+    # Only build the tree for the timeline items
+    soup = BeautifulSoup(page, 'lxml', parse_only=_ONLY_TIMELINE_ITEMS)
+    
+    # Parse Nitter timeline posts
+    timeline_items = _SEL_ITEM.select(soup)
     
-    for instance in nitter_instances:
+    for item in timeline_items[:MAX_POSTS_PER_CYCLE]:
         try:
-            url = f"{instance}/{username}"
-            log.info(f"Trying Nitter instance: {url}")
-            
-            response = await client.get(
-                url,
-                timeout=TIMEOUT,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                }
-            )
-            
-            if response.status_code != 200:
-                log.warning(f"Instance {instance} returned status {response.status_code}")
+            # Extract post ID from link
+            post_link = _SEL_LINK.select_one(item)
+            if not post_link:
+                continue
+                
+            post_url = post_link.get('href', '')
+            post_id_match = _RE_STATUS.search(post_url)
+            if not post_id_match:
                 continue
                 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            post_id = post_id_match.group(1)
             
-            # Parse Nitter timeline posts
-            timeline_items = soup.select('.timeline-item')
+            # Extract content
+            content_elem = _SEL_CONTENT.select_one(item)
+            content = content_elem.get_text(strip=True) if content_elem else ""
             
-            for item in timeline_items[:MAX_POSTS_PER_CYCLE]:
+            # Extract timestamp
+            timestamp = None
+            time_elem = _SEL_DATE.select_one(item)
+            if time_elem and time_elem.get('title'):
                 try:
-                    # Extract post ID from link
-                    post_link = item.select_one('.tweet-link')
-                    if not post_link:
-                        continue
-                        
-                    post_url = post_link.get('href', '')
-                    post_id_match = re.search(r'/status/(\d+)', post_url)
-                    if not post_id_match:
-                        continue
-                        
-                    post_id = post_id_match.group(1)
-                    
-                    # Extract content
-                    content_elem = item.select_one('.tweet-content')
-                    content = content_elem.get_text(strip=True) if content_elem else ""
-                    
-                    # Extract timestamp
-                    timestamp = None
-                    time_elem = item.select_one('.tweet-date a')
-                    if time_elem and time_elem.get('title'):
-                        try:
-                            timestamp = datetime.strptime(
-                                time_elem['title'], 
-                                "%b %d, %Y · %I:%M %p %Z"
-                            ).replace(tzinfo=timezone.utc)
-                        except:
-                            pass
-                    
-                    # Extract images
-                    images = []
-                    for img in item.select('.attachment-image img'):
-                        img_src = img.get('src', '')
-                        if img_src:
-                            # Convert nitter image URL to Twitter image URL
-                            if '/pic/' in img_src:
-                                images.append(img_src)
-                    
-                    # Extract metrics
-                    metrics = {}
-                    stats = item.select('.tweet-stat')
-                    for stat in stats:
-                        icon = stat.select_one('.icon-container')
-                        value = stat.select_one('.tweet-stat-value')
-                        if icon and value:
-                            if 'icon-comment' in str(icon):
-                                metrics['replies'] = value.get_text(strip=True)
-                            elif 'icon-retweet' in str(icon):
-                                metrics['retweets'] = value.get_text(strip=True)
-                            elif 'icon-heart' in str(icon):
-                                metrics['likes'] = value.get_text(strip=True)
-                    
-                    posts.append(XPost(
-                        post_id=post_id,
-                        username=username,
-                        content=content,
-                        timestamp=timestamp,
-                        images=images,
-                        metrics=metrics
-                    ))
-                    
-                except Exception as e:
-                    log.warning(f"Error parsing post item: {e}")
-                    continue
+                    timestamp = datetime.strptime(
+                        time_elem['title'], 
+                        "%b %d, %Y · %I:%M %p %Z"
+                    ).replace(tzinfo=timezone.utc)
+                except:
+                    pass
+            
+            # Extract images
+            images = []
+            for img in _SEL_IMAGES.select(item):
+                img_src = img.get('src', '')
+                if img_src:
+                    # Convert nitter image URL to Twitter image URL
+                    if '/pic/' in img_src:
+                        images.append(img_src)
+            
+            # Extract metrics
+            metrics = {}
+            stats = _SEL_STATS.select(item)
+            for stat in stats:
+                icon = _SEL_ICON.select_one(stat)
+                value = _SEL_STAT_VALUE.select_one(stat)
+                if icon and value:
+                    # The icon-* class sits on the container or (usually) a child span
+                    cls = set(icon.get('class') or [])
+                    for child in icon.find_all(class_=True):
+                        cls.update(child['class'])
+                    if 'icon-comment' in cls:
+                        metrics['replies'] = value.get_text(strip=True)
+                    elif 'icon-retweet' in cls:
+                        metrics['retweets'] = value.get_text(strip=True)
+                    elif 'icon-heart' in cls:
+                        metrics['likes'] = value.get_text(strip=True)
+            
+            posts.append(XPost(
+                post_id=post_id,
+                username=username,
+                content=content,
+                timestamp=timestamp,
+                images=images,
+                metrics=metrics
+            ))
             
-            if posts:
-                log.info(f"Successfully fetched {len(posts)} posts from {instance}")
-                return posts
-                
         except Exception as e:
-            log.warning(f"Failed to fetch from {instance}: {e}")
+            log.warning("Error parsing post item: %s", e)
             continue
     
     return posts
 
+# ETag / Last-Modified from each instance's last usable timeline, for conditional GETs
+_nitter_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+async def fetch_nitter_instance(client: httpx.AsyncClient, instance: str, 
+                                username: str) -> Optional[List[XPost]]:
+    """
+    Fetch and parse the timeline from a single Nitter instance.
+    Returns [] if the timeline is unchanged since our last fetch (304),
+    or None if the instance gave us nothing usable.
+    """
+    url = f"{instance}/{username}"
+    log.info("Trying Nitter instance: %s", url)
+    
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+    etag, last_modified = _nitter_validators.get(instance, (None, None))
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    
+    response = await client.get(url, headers=headers)
+    
+    if response.status_code == 304:
+        log.info("Instance %s: timeline not modified", instance)
+        return []
+    if response.status_code != 200:
+        log.warning("Instance %s returned status %s", instance, response.status_code)
+        return None
+    
+    posts = parse_nitter_timeline(response.text, username)
+    if not posts:
+        return None
+    # Only remember validators for pages we could actually parse
+    _nitter_validators[instance] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return posts
+
+async def fetch_x_posts_nitter(client: httpx.AsyncClient, username: str) -> Optional[List[XPost]]:
+    """
+    Fetch X posts using Nitter instances (privacy-focused Twitter frontend).
+    All instances are queried concurrently; the first one that returns posts
+    wins and the rest are cancelled. An unchanged (304) answer doesn't win, since
+    a lagging mirror can answer that while a fresher one has new posts.
+    Returns [] if no instance had posts but one reported the timeline unchanged,
+    and None if every instance failed.
+    """
+    tasks = {
+        asyncio.create_task(fetch_nitter_instance(client, instance, username)): instance
+        for instance in NITTER_INSTANCES
+    }
+    pending = set(tasks)
+    unchanged = False
+    
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                instance = tasks[task]
+                if task.exception():
+                    log.warning("Failed to fetch from %s: %s", instance, task.exception())
+                    continue
+                posts = task.result()
+                if posts is None:
+                    continue
+                if not posts:
+                    unchanged = True
+                    continue
+                log.info("Successfully fetched %s posts from %s", len(posts), instance)
+                return posts
+    finally:
+        for task in pending:
+            task.cancel()
+    
+    return [] if unchanged else None
+
+# JSON state x.com embeds in its HTML
+_RE_INITIAL_STATE = re.compile(
+    rb'window\.__INITIAL_STATE__\s*=\s*(\{.*?\});\s*(?:window\.|</script>)', re.S
+)
+
+def parse_initial_state(state: Dict, username: str) -> List[XPost]:
+    """
+    Extract the user's tweets from x.com's __INITIAL_STATE__ (best effort).
+    """
+    entities = state.get("entities") or {}
+    tweets = (entities.get("tweets") or {}).get("entities") or {}
+    users = (entities.get("users") or {}).get("entities") or {}
+    
+    posts = []
+    for tweet_id, tweet in tweets.items():
+        if not isinstance(tweet, dict) or not str(tweet_id).isdigit():
+            continue
+        # Skip tweets by other accounts (quoted/retweeted) when the author is known
+        author = users.get(str(tweet.get("user") or tweet.get("user_id_str") or ""), {})
+        if author.get("screen_name") and author["screen_name"].lower() != username.lower():
+            continue
+        
+        timestamp = None
+        if tweet.get("created_at"):
+            try:
+                timestamp = datetime.strptime(tweet["created_at"], "%a %b %d %H:%M:%S %z %Y")
+            except ValueError:
+                pass
+        
+        posts.append(XPost(
+            post_id=str(tweet_id),
+            username=username,
+            content=tweet.get("full_text") or tweet.get("text") or "",
+            timestamp=timestamp
+        ))
+    
+    # Newest first
+    posts.sort(key=lambda p: int(p.post_id), reverse=True)
+    return posts[:MAX_POSTS_PER_CYCLE]
+
 async def fetch_x_posts_api(client: httpx.AsyncClient, username: str) -> List[XPost]:
     """
     Alternative: Fetch posts using unofficial X/Twitter API endpoints.
@@ -241,35 +449,44 @@ async def fetch_x_posts_api(client: httpx.AsyncClient, username: str) -> List[XP
         # Try to get posts via X's web API (may require auth)
         url = f"https://x.com/{username}"
         
-        response = await client.get(
+        # Stream the page and stop reading as soon as the embedded state has arrived.
+        # Accept-Encoding is left to httpx so it only offers codecs it can decode.
+        match = None
+        page = bytearray()
+        async with client.stream(
+            "GET",
             url,
-            timeout=TIMEOUT,
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate, br",
                 "DNT": "1",
                 "Connection": "keep-alive",
                 "Upgrade-Insecure-Requests": "1"
             }
-        )
-        
-        if response.status_code != 200:
-            log.warning(f"X.com returned status {response.status_code}")
-            return posts
-        
-        # Parse the HTML to extract initial data
-        soup = BeautifulSoup(response.text, 'html.parser')
+        ) as response:
+            if response.status_code != 200:
+                log.warning("X.com returned status %s", response.status_code)
+                return posts
+            
+            async for chunk in response.aiter_bytes():
+                page.extend(chunk)
+                if b'window.__INITIAL_STATE__' in page:
+                    match = _RE_INITIAL_STATE.search(page)
+                    if match:
+                        break
         
-        # Look for React data in script tags
-        for script in soup.find_all('script'):
-            if script.string and 'window.__INITIAL_STATE__' in script.string:
-                # Extract and parse the JSON data
-                # This is a simplified approach - actual implementation would need proper parsing
-                pass
+        # Look for the embedded React state without building the HTML tree
+        if match:
+            try:
+                posts = parse_initial_state(orjson.loads(match.group(1)), username)
+            except orjson.JSONDecodeError as e:
+                log.warning("Could not decode __INITIAL_STATE__: %s", e)
+            if posts:
+                return posts
         
         # Fallback to basic HTML scraping
+        soup = BeautifulSoup(bytes(page), 'lxml')
         articles = soup.find_all('article', {'data-testid': 'tweet'})
         
         for article in articles[:MAX_POSTS_PER_CYCLE]:
@@ -279,8 +496,9 @@ async def fetch_x_posts_api(client: httpx.AsyncClient, username: str) -> List[XP
                 post_id = None
                 for link in links:
                     href = link['href']
-                    if '/status/' in href:
-                        post_id = href.split('/status/')[-1].split('?')[0]
+                    m = _RE_STATUS.search(href)
+                    if m:
+                        post_id = m.group(1)
                         break
                 
                 if not post_id:
@@ -300,89 +518,76 @@ async def fetch_x_posts_api(client: httpx.AsyncClient, username: str) -> List[XP
                 ))
                 
             except Exception as e:
-                log.warning(f"Error parsing article: {e}")
+                log.warning("Error parsing article: %s", e)
                 continue
                 
     except Exception as e:
-        log.warning(f"Failed to fetch from x.com directly: {e}")
+        log.warning("Failed to fetch from x.com directly: %s", e)
     
     return posts
 
-async def fetch_x_posts(client: httpx.AsyncClient, username: str) -> List[XPost]:
+async def fetch_x_posts(client: httpx.AsyncClient, username: str) -> Optional[List[XPost]]:
     """
     Main function to fetch X posts, trying multiple methods.
+    Returns [] if the timeline is unchanged and None if every method failed.
     """
     # Try Nitter first (more reliable, no auth needed)
     posts = await fetch_x_posts_nitter(client, username)
     
-    # If Nitter fails, try direct X.com scraping
-    if not posts:
+    # If Nitter fails, try direct X.com scraping ([] means "not modified", not a failure)
+    if posts is None:
         log.info("Nitter failed, trying direct X.com scraping...")
-        posts = await fetch_x_posts_api(client, username)
+        posts = await fetch_x_posts_api(client, username) or None
     
     return posts
 
 # ---------- Telegram Formatting ----------
+_RE_MENTION = re.compile(r'@(\w+)')
+_RE_HASHTAG = re.compile(r'#(\w+)')
+
+_METRIC_ICONS = (("replies", "💬"), ("retweets", "🔁"), ("likes", "❤️"))
+
 def format_x_post_message(post: XPost) -> str:
     """
     Format an X post for Telegram with rich formatting.
+    Optional blocks carry their own trailing newlines so the message is one template.
     """
     # Escape HTML special characters
     def h(text: str) -> str:
         return html.escape(text or "", quote=False)
     
     # Format timestamp
-    time_str = ""
-    if post.timestamp:
-        time_str = post.timestamp.strftime("%Y-%m-%d %H:%M UTC")
-    
-    # Build message parts
-    lines = []
-    
-    # Header with X logo and username
-    lines.append(f"<b>𝕏 @{h(post.username)}</b>")
-    if time_str:
-        lines.append(f"<i>{h(time_str)}</i>")
-    lines.append("")  # Empty line
+    time_line = f"<i>{post.timestamp:%Y-%m-%d %H:%M UTC}</i>\n" if post.timestamp else ""
     
     # Post content
+    content_block = ""
     if post.content:
-        # Convert @mentions to links
-        content = h(post.content)
-        content = re.sub(
-            r'@(\w+)', 
-            r'<a href="https://x.com/\1">@\1</a>', 
-            content
-        )
-        # Convert hashtags to links
-        content = re.sub(
-            r'#(\w+)', 
-            r'<a href="https://x.com/hashtag/\1">#\1</a>', 
-            content
-        )
-        lines.append(content)
-        lines.append("")  # Empty line
+        # Convert @mentions and hashtags to links
+        content = _RE_MENTION.sub(r'<a href="https://x.com/\1">@\1</a>', h(post.content))
+        content = _RE_HASHTAG.sub(r'<a href="https://x.com/hashtag/\1">#\1</a>', content)
+        content_block = f"{content}\n\n"
     
     # Metrics if available
+    metrics_block = ""
     if post.metrics:
-        metrics_parts = []
-        if 'replies' in post.metrics:
-            metrics_parts.append(f"💬 {post.metrics['replies']}")
-        if 'retweets' in post.metrics:
-            metrics_parts.append(f"🔁 {post.metrics['retweets']}")
-        if 'likes' in post.metrics:
-            metrics_parts.append(f"❤️ {post.metrics['likes']}")
-        
+        metrics_parts = [f"{icon} {post.metrics[key]}" for key, icon in _METRIC_ICONS if key in post.metrics]
         if metrics_parts:
-            lines.append(" • ".join(metrics_parts))
-            lines.append("")  # Empty line
+            metrics_block = " • ".join(metrics_parts) + "\n\n"
     
-    # Add link to original post
-    lines.append(f"🔗 <a href=\"{h(post.url)}\">View on X</a>")
-    
-    return "\n".join(lines)
+    # Header with X logo and username, then the blocks and a link to the original post
+    return (
+        f"<b>𝕏 @{h(post.username)}</b>\n"
+        f"{time_line}\n"
+        f"{content_block}{metrics_block}"
+        f"🔗 <a href=\"{h(post.url)}\">View on X</a>"
+    )
 
 # ---------- Telegram API ----------
+# Telegram flood limits (shared with the RSS bot): ~30 msg/s per bot, 1 msg/s and 20 msg/min per group.
+TG_CHAT_SECOND, TG_CHAT_MINUTE = chat_limiters(CHAT_ID)
+# Monotonic time before which no send may start (set by any 429 so all senders back off)
+_tg_retry_at = 0.0
+
 async def tg_send_message(client: httpx.AsyncClient, text: str, 
                           disable_preview: bool = False) -> Optional[int]:
     """
@@ -399,13 +604,17 @@ async def tg_send_message(client: httpx.AsyncClient, text: str,
     max_retries = 3
     retry_count = 0
     
+    global _tg_retry_at
     while retry_count < max_retries:
         try:
-            response = await client.post(
-                f"{TELEGRAM_API}/sendMessage",
-                json=payload,
-                timeout=TIMEOUT
-            )
+            wait = _tg_retry_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            async with TG_LIMITER, TG_CHAT_SECOND, TG_CHAT_MINUTE:
+                response = await client.post(
+                    f"{TELEGRAM_API}/sendMessage",
+                    json=payload
+                )
             
             if response.status_code == 429:
                 # Rate limited
@@ -416,10 +625,9 @@ async def tg_send_message(client: httpx.AsyncClient, text: str,
                 except:
                     pass
                 
-                log.info(f"Hit Telegram rate limit, waiting {retry_after}s...")
-                await asyncio.sleep(retry_after)
-                retry_count += 1
-                continue
+                log.info("Hit Telegram rate limit, waiting %ss...", retry_after)
+                _tg_retry_at = max(_tg_retry_at, time.monotonic() + retry_after)
+                continue  # flood control is not a failure; don't spend a retry on it
             
             response.raise_for_status()
             data = response.json()
@@ -427,11 +635,11 @@ async def tg_send_message(client: httpx.AsyncClient, text: str,
             if data.get("ok"):
                 return data.get("result", {}).get("message_id")
             else:
-                log.warning(f"Telegram API error: {data}")
+                log.warning("Telegram API error: %s", data)
                 return None
                 
         except Exception as e:
-            log.error(f"Failed to send message: {e}")
+            log.error("Failed to send message: %s", e)
             retry_count += 1
             if retry_count < max_retries:
                 await asyncio.sleep(2 ** retry_count)
@@ -451,70 +659,74 @@ async def tg_send_with_preview(client: httpx.AsyncClient, post: XPost) -> Option
     return msg_id
 
 # ---------- Main Processing Loop ----------
-async def process_x_feed(client: httpx.AsyncClient) -> int:
+async def process_x_feed(client: httpx.AsyncClient) -> Tuple[int, Optional[int]]:
     """
     Fetch and process X posts from the configured username.
-    Returns the number of posts sent to Telegram.
+    Returns (posts sent to Telegram, new posts found); the second is None if the fetch failed.
     """
     posted_count = 0
+    new_count = None
     
     try:
         # Fetch latest posts
         posts = await fetch_x_posts(client, X_USERNAME)
         
+        if posts is None:
+            log.info("No posts fetched from @%s", X_USERNAME)
+            return 0, None
         if not posts:
-            log.info(f"No posts fetched from @{X_USERNAME}")
-            return 0
+            log.info("Timeline of @%s unchanged", X_USERNAME)
+            return 0, 0
         
-        log.info(f"Fetched {len(posts)} posts from @{X_USERNAME}")
+        log.info("Fetched %s posts from @%s", len(posts), X_USERNAME)
         
-        # Process posts (newest first)
-        for post in posts:
+        # Check which posts we've seen before
+        known = seen_ids([post.post_id for post in posts])
+        
+        # Seen rows are written together at the end of the cycle
+        pending = []
+        
+        async def send(post: XPost) -> int:
             try:
-                # Check if we've seen this post before
-                if seen_before(DB_PATH, post.post_id):
-                    log.debug(f"Already seen post {post.post_id}")
-                    continue
-                
                 # Send to Telegram
-                log.info(f"Sending post {post.post_id} to Telegram...")
+                log.info("Sending post %s to Telegram...", post.post_id)
                 msg_id = await tg_send_with_preview(client, post)
+                posted_at = int(post.timestamp.timestamp()) if post.timestamp else None
                 
                 if msg_id:
                     # Mark as seen with Telegram message ID
-                    mark_seen(
-                        DB_PATH,
-                        post.post_id,
-                        post.username,
-                        post.content,
-                        int(post.timestamp.timestamp()) if post.timestamp else None,
-                        msg_id
-                    )
-                    posted_count += 1
-                    log.info(f"Successfully posted {post.post_id} (Telegram msg: {msg_id})")
-                    
-                    # Rate limit ourselves
-                    await asyncio.sleep(1)
-                else:
-                    log.warning(f"Failed to send post {post.post_id}")
-                    # Still mark as seen to avoid retry loops
-                    mark_seen(
-                        DB_PATH,
-                        post.post_id,
-                        post.username,
-                        post.content,
-                        int(post.timestamp.timestamp()) if post.timestamp else None,
-                        None
-                    )
-                    
+                    mark_seen(pending, post.post_id, post.username, post.content, posted_at, msg_id)
+                    log.info("Successfully posted %s (Telegram msg: %s)", post.post_id, msg_id)
+                    return 1
+                
+                log.warning("Failed to send post %s", post.post_id)
+                # Still mark as seen to avoid retry loops
+                mark_seen(pending, post.post_id, post.username, post.content, posted_at, None)
             except Exception as e:
-                log.error(f"Error processing post {post.post_id}: {e}")
-                continue
+                log.error("Error processing post %s: %s", post.post_id, e)
+            return 0
+        
+        new_posts = []
+        for post in posts:
+            if post.post_id in known:
+                log.debug("Already seen post %s", post.post_id)
+            else:
+                new_posts.append(post)
+        new_count = len(new_posts)
+        
+        # Send one at a time so posts land in a fixed order (newest first);
+        # the per-chat limiter keeps them 1s apart
+        try:
+            for post in new_posts:
+                posted_count += await send(post)
+        finally:
+            await asyncio.to_thread(flush_seen, pending)
                 
     except Exception as e:
-        log.error(f"Error in process_x_feed: {e}")
+        log.error("Error in process_x_feed: %s", e)
+        new_count = None
     
-    return posted_count
+    return posted_count, new_count
 
 async def run_loop():
     """
@@ -523,61 +735,91 @@ async def run_loop():
     # Initialize database
     init_db(DB_PATH)
     
-    log.info(f"Starting Wildmeta X Bot")
-    log.info(f"Username: @{X_USERNAME}")
-    log.info(f"Chat ID: {CHAT_ID}, Thread ID: {X_THREAD_ID}")
-    log.info(f"Poll interval: {POLL_SECONDS}s")
-    log.info(f"Max posts per cycle: {MAX_POSTS_PER_CYCLE}")
+    log.info("Starting Wildmeta X Bot")
+    log.info("Username: @%s", X_USERNAME)
+    log.info("Chat ID: %s, Thread ID: %s", CHAT_ID, X_THREAD_ID)
+    log.info("Poll interval: %ss (up to %ss when quiet)", POLL_SECONDS, MAX_POLL_SECONDS)
+    log.info("Max posts per cycle: %s", MAX_POSTS_PER_CYCLE)
     
-    async with httpx.AsyncClient(
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        },
-        follow_redirects=True,
-    ) as client:
-        # Initial run
-        try:
-            count = await process_x_feed(client)
-            if count > 0:
-                log.info(f"Initial run: posted {count} new posts")
-        except Exception as e:
-            log.error(f"Error in initial run: {e}")
-        
-        # Main loop
-        while True:
+    try:
+        async with httpx.AsyncClient(
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            },
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+            timeout=httpx.Timeout(connect=10, read=TIMEOUT, write=10, pool=5),
+        ) as client:
+            # Initial run
             try:
-                # Wait for next poll
-                await asyncio.sleep(POLL_SECONDS)
+                count, _ = await process_x_feed(client)
+                if count > 0:
+                    log.info("Initial run: posted %s new posts", count)
+            except Exception as e:
+                log.error("Error in initial run: %s", e)
+        
+            # Main loop; the poll interval doubles after each cycle whose fetch found
+            # nothing new (up to MAX_POLL_SECONDS). A failed fetch or new posts reset it,
+            # even if they couldn't be sent, since that's when the bot may be behind.
+            cycles = 0
+            empty_cycles = 0
+            sleep_s = POLL_SECONDS
+            while True:
+                try:
+                    # Wait for next poll
+                    await asyncio.sleep(sleep_s)
                 
-                # Process feed
-                start_time = time.time()
-                count = await process_x_feed(client)
-                duration = time.time() - start_time
+                    # Process feed
+                    start_time = time.time()
+                    count, new = await process_x_feed(client)
+                    duration = time.time() - start_time
                 
-                log.info(json.dumps({
-                    "event": "cycle_complete",
-                    "posted": count,
-                    "duration_s": round(duration, 2),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }))
+                    log.info(json.dumps({
+                        "event": "cycle_complete",
+                        "posted": count,
+                        "new": new,
+                        "duration_s": round(duration, 2),
+                        "timestamp": datetime.now(timezone.utc).isoformat()
+                    }))
+                    
+                    if new == 0:
+                        empty_cycles = min(empty_cycles + 1, 6)
+                        sleep_s = min(POLL_SECONDS * (1 << empty_cycles), max(MAX_POLL_SECONDS, POLL_SECONDS))
+                    else:
+                        empty_cycles = 0
+                        sleep_s = POLL_SECONDS
+                    
+                    cycles += 1
+                    if cycles % CHECKPOINT_EVERY_CYCLES == 0:
+                        await asyncio.to_thread(checkpoint_db)
                 
-            except KeyboardInterrupt:
-                log.info("Received interrupt signal, shutting down...")
-                break
-            except Exception as e:
-                log.error(f"Error in main loop: {e}")
-                await asyncio.sleep(30)  # Wait before retrying
+                except KeyboardInterrupt:
+                    log.info("Received interrupt signal, shutting down...")
+                    break
+                except Exception as e:
+                    log.error("Error in main loop: %s", e)
+                    await asyncio.sleep(30)  # Wait before retrying
+    finally:
+        close_db()
 
 def main():
     """
     Entry point for the bot.
     """
     try:
-        asyncio.run(run_loop())
+        import uvloop  # optional libuv-backed event loop; not available on Windows
+    except ImportError:
+        uvloop = None
+    try:
+        if uvloop is not None:
+            uvloop.run(run_loop())
+        else:
+            asyncio.run(run_loop())
     except KeyboardInterrupt:
         log.info("Bot stopped by user.")
     except Exception as e:
-        log.error(f"Fatal error: {e}")
+        log.error("Fatal error: %s", e)
         raise
 
 if __name__ == "__main__":